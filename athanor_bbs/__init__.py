@@ -20,6 +20,21 @@ class AthanorBBS(EvPlugin):
 
     def at_init_settings(self, settings):
         settings.BASE_BOARD_TYPECLASS = "athanor_bbs.boards.boards.DefaultBoard"
+        settings.BBS_PAGE_SIZE = 20
+        settings.BBS_POSTS_PER_PAGE = 3
+        settings.BBS_REVISION_SNAPSHOT_INTERVAL = 10
+        settings.BBS_DIGEST_INTERVAL = 3600
+        settings.BBS_RENDER_THREADS = 4
+        settings.BBS_RENDER_JOBS_PER_SESSION = 2
+        # Flood control token buckets, as (capacity, tokens regained per second).
+        settings.BBS_FLOOD_IDENTITY = (5, 1 / 60)
+        settings.BBS_FLOOD_BOARD = (30, 1 / 10)
+        settings.BBS_FLOOD_EXEMPT_LOCK = "dummy:perm(Admin)"
+        # Set to a DATABASES alias to serve read-only BBS views from a replica.
+        settings.BBS_READ_DATABASE = None
+        settings.BBS_REPLICA_PIN_SECONDS = 10
+        settings.DATABASE_ROUTERS = list(getattr(settings, 'DATABASE_ROUTERS', [])) + \
+            ["athanor_bbs.boards.routers.BoardRouter"]
         settings.INSTALLED_APPS.append("athanor_bbs.boards")
         settings.CONTROLLERS['board'] = {
             'controller': 'athanor_bbs.boards.controller.AthanorBoardController',
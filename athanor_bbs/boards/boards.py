@@ -4,17 +4,20 @@ from django.db.models import F, Q
 
 
 from evennia.locks.lockhandler import LockException
-from evennia.utils.validatorfuncs import lock as validate_lock
+from evennia.utils.validatorfuncs import lock as validate_lock, boolean, unsigned_integer
 from evennia.utils.utils import lazy_property, class_from_module
 from evennia.typeclasses.models import TypeclassBase
 from evennia.typeclasses.managers import TypeclassManager
 
 from athanor.utils.online import puppets as online_puppets
 from athanor.utils.time import utcnow
-from athanor.utils.text import clean_and_ansi
+from athanor.utils.text import clean_and_ansi, partial_match
 
 from athanor_bbs.boards.models import BoardDB
 from athanor_bbs.boards import messages as fmsg
+from athanor_bbs.boards.membership import IGNORES
+from athanor_bbs.boards.registry import BOARDS
+from athanor_bbs.boards.search import BOARD_NAMES
 
 
 class DefaultBoard(BoardDB, metaclass=TypeclassBase):
@@ -32,7 +35,7 @@ class DefaultBoard(BoardDB, metaclass=TypeclassBase):
         return {'name': self.key,
                 'cname': self.ckey,
                 'typename': 'BBS Board',
-                'fullname': self.fullname}
+                'fullname': self.fullname()}
 
     @classmethod
     def create(cls, identity, key, order, **kwargs):
@@ -45,6 +48,19 @@ class DefaultBoard(BoardDB, metaclass=TypeclassBase):
         board.save()
         return board
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        BOARDS.saved(self)
+        BOARD_NAMES.add(self.pk, self.db_key)
+
+    def delete(self):
+        board_id = self.pk
+        result = super().delete()
+        BOARDS.deleted(board_id)
+        BOARD_NAMES.remove(board_id)
+        IGNORES.forget_board(board_id)
+        return result
+
     def __str__(self):
         return self.key
 
@@ -58,9 +74,9 @@ class DefaultBoard(BoardDB, metaclass=TypeclassBase):
 
     @property
     def prefix_order(self):
-        return f'{self.owner.db_abbreviation}{self.db_order}'
+        return self.alias
 
-    def parse_postnums(self, account, check=None):
+    def parse_ordernums(self, account, check=None):
         if not check:
             raise ValueError("No posts entered to check.")
         fullnums = []
@@ -77,11 +93,26 @@ class DefaultBoard(BoardDB, metaclass=TypeclassBase):
                 fullnums.append(int(arg))
             if re.match(r"^U$", arg.upper()):
                 fullnums += self.unread_posts(account).values_list('db_order', flat=True)
+        return fullnums
+
+    def parse_postnums(self, account, check=None):
+        fullnums = self.parse_ordernums(account, check)
         posts = self.posts.filter(db_order__in=fullnums).order_by('db_order')
-        if not posts:
+        if not posts.exists():
             raise ValueError("posts not found!")
         return posts
 
+    def find_post(self, account, post=None):
+        if not post:
+            raise ValueError("No post entered to find!")
+        try:
+            order = int(post)
+        except ValueError:
+            raise ValueError("Posts must be chosen by number!")
+        if not (found := self.topics.filter(db_order=order).first()):
+            raise ValueError(f"Post {self.prefix_order}/{order} not found!")
+        return found
+
     def check_permission(self, checker=None, mode="read", checkadmin=True):
         if checker.locks.check_lockstring(checker, 'dummy:perm(Admin)'):
             return True
@@ -109,7 +140,7 @@ class DefaultBoard(BoardDB, metaclass=TypeclassBase):
 
     def listeners(self):
         return [char for char in online_puppets() if self.check_permission(checker=char)
-                and char not in self.ignore_list.all()]
+                and not IGNORES.is_ignoring(char, self)]
 
     def squish_posts(self):
         for count, post in enumerate(self.posts.order_by('date_created')):
@@ -130,6 +161,27 @@ class DefaultBoard(BoardDB, metaclass=TypeclassBase):
     def change_order(self, new_order):
         pass
 
+    config_options = {
+        'mandatory': ('db_mandatory', boolean),
+        'anonymous': ('db_anonymous', boolean),
+        'retention': ('db_retention', unsigned_integer),
+        'page_size': ('db_page_size', unsigned_integer),
+    }
+
+    def change_config(self, option, value):
+        if not option:
+            raise ValueError("No option entered to configure!")
+        if not (found := partial_match(option, self.config_options.keys())):
+            raise ValueError(f"Unknown option '{option}'. Choices are: {', '.join(self.config_options.keys())}")
+        field, validator = self.config_options[found]
+        value = validator(value, option_key=f"BBS Board {found}")
+        setattr(self, field, value)
+        self.save(update_fields=[field])
+        return found, value
+
+    def posts_per_page(self):
+        return self.db_page_size or settings.BBS_PAGE_SIZE
+
     def change_locks(self, new_locks):
         if not new_locks:
             raise ValueError("No locks entered!")
@@ -1,5 +1,7 @@
 from athanor.commands.command import AthanorCommand
 
+from athanor_bbs.boards.routers import use_replica, pin_primary
+
 
 class BBSCommand(AthanorCommand):
     """
@@ -130,7 +132,9 @@ class CmdBBSAdmin(BBSCommand):
         @fboard/rename <board>=<new name> - Renames a board.
         @fboard/order <board>=<new order> - Change a board's order.
         @fboard/lock <board>=<lock string> - Lock a board.
-        @fboard/config <board>=<option>,<val>
+        @fboard/stats - Show BBS rendering timings and cache hit rates.
+        @fboard/config <board>=<option>,<val> - Options are mandatory, anonymous,
+            retention (days, 0 keeps forever) and page_size (0 uses the default).
 
     Board Membership
         @fboard/join <alias> - Join a board.
@@ -147,7 +151,8 @@ class CmdBBSAdmin(BBSCommand):
     key = "@fboard"
     aliases = ['+bboard']
     entity_type = 'board'
-    switch_options = ('create', 'delete', 'rename', 'order', 'grant', 'revoke', 'ban', 'unban', 'lock', 'join', 'leave')
+    switch_options = ('create', 'delete', 'rename', 'order', 'grant', 'revoke', 'ban', 'unban', 'lock', 'join', 'leave',
+                      'config', 'stats')
 
     switch_syntax = {
         'create': '<category>=<boardname>,<order>',
@@ -160,28 +165,30 @@ class CmdBBSAdmin(BBSCommand):
         'unban': '<board>=<user>',
         'lock': '<board>=<lockstring>',
         'join': '<board>',
-        'leave': '<board>'
+        'leave': '<board>',
+        'config': '<board>=<option>,<value>'
     }
 
     def switch_main(self):
-        self.msg(self.controller.render_board_list(self.session))
+        self.controller.render_deferred(self.session, self.controller.render_board_list, self.session)
 
     def switch_create(self):
         name, order = self.rhslist
         self.controller.create_board(self.session, category=self.lhs, name=name, order=order)
 
+    def switch_stats(self):
+        self.msg(self.controller.render_stats(self.session))
+
     def switch_order(self):
         self._switch_single('order')
 
     def switch_join(self):
-        board = self.controller.find_board(self.session, self.args, visible_only=False)
-        board.ignore_list.remove(self.caller)
+        board = self.controller.join_board(self.session, self.args)
+        self.msg(f"You have joined {board.prefix_order}: {board.key}")
 
     def switch_leave(self):
-        board = self.controller.find_board(self.session, self.args)
-        if board.mandatory:
-            raise ValueError("Cannot leave mandatory bbs!")
-        board.ignore_list.add(self.caller)
+        board = self.controller.leave_board(self.session, self.args)
+        self.msg(f"You have left {board.prefix_order}: {board.key}")
 
 
 class CmdBBSPost(BBSCommand):
@@ -192,8 +199,10 @@ class CmdBBSPost(BBSCommand):
     Writing Posts
         @fpost <board>/<title>=<text> - Creates a new post on <board> called <title> with the text <text>.
         @fpost/rename <board>/<post>=<new title> - Changes the title/subject of a thread.
-        @fpost/move <board>/<post>=<destination board> - Relocate a thread if you have permission.
-        @fpost/delete <board>/<post>=<verify name> - Remove a post. Requires permissions.
+        @fpost/move <board>/<posts>=<destination board> - Relocate threads if you have permission.
+        @fpost/delete <board>/<posts>=<posts> - Remove threads. Requires permissions.
+            Repeat <posts> after the = to confirm.
+            For both, <posts> may be several numbers and ranges, such as 10-400,412.
         @fpost/edit <board>/<post>=<before>^^^<after>
     """
     key = '@fpost'
@@ -202,8 +211,8 @@ class CmdBBSPost(BBSCommand):
 
     switch_syntax = {
         'rename': '<board>/<post>=<new name>',
-        'delete': '<board>/<post>=<verify name>',
-        'move': '<board>/<post>=<new board>',
+        'delete': '<board>/<posts>=<posts>',
+        'move': '<board>/<posts>=<new board>',
         'edit': '<board>/<post>=<search>^^^<replace>',
         'main': '<board>/<title>=<post text>'
     }
@@ -221,11 +230,19 @@ class CmdBBSPost(BBSCommand):
                                                 seek_text=search, replace_text=replace)
 
     def switch_move(self):
-        self.controller.move_post(self.session, board=self.lhslist[0], post=self.lhslist[1],
-                                                destination=self.rhs)
+        if '/' not in self.lhs:
+            raise ValueError("Usage: +bbpost/move <board>/<posts>=<new board>")
+        board, posts = self.lhs.split('/', 1)
+        board, destination, count = self.controller.move_posts(self.session, board=board, posts=posts,
+                                                               destination=self.rhs)
+        self.msg(f"Moved {count} posts from {board.prefix_order} to {destination.prefix_order}.")
 
     def switch_delete(self):
-        self.controller.delete_post(self.session, board=self.lhslist[0], post=self.lhslist[1])
+        if '/' not in self.lhs:
+            raise ValueError("Usage: +bbpost/delete <board>/<posts>=<posts>")
+        board, posts = self.lhs.split('/', 1)
+        board, count = self.controller.delete_posts(self.session, board=board, posts=posts, verify=self.rhs)
+        self.msg(f"Deleted {count} posts from {board.prefix_order}.")
 
 
 class CmdBBSRead(BBSCommand):
@@ -235,7 +252,8 @@ class CmdBBSRead(BBSCommand):
 
     Reading Posts
         @fread - Show all message boards and brief information.
-        @fread <board> - Shows a board's messages. <board> must be the ID such as AB1 or 3, not name.
+        @fread <board> - Shows a board's messages. <board> may be the ID such as AB1, or
+            all or part of its name if that matches only one board. Other commands need the ID.
         @fread <board>/<threads> - Read a message. <list> is comma-seperated.
             Entries can be single numbers, number ranges (ie. 1-6), or u (for 'all
             unread'), in any combination or order - duplicates will not be shown.
@@ -244,18 +262,48 @@ class CmdBBSRead(BBSCommand):
         @fread/catchup <board> - Mark all threads on a board as read. use /catchup all to
             mark the entire bbs as read.
         @fread/scan - Lists unread messages in compact form.
+        @fread/recent [<board>] - Lists threads by latest activity, on one board or all of
+            them. Long listings end with a cursor: use @fread/recent [<board>]=<cursor>
+            to see the next page.
+        @fread/find [<board>=]<title> - Lists threads whose titles resemble <title>.
+        @fread/history <board>/<thread> - Lists past revisions of a thread's first post.
+        @fread/history <board>/<thread>=<revision> - Shows that revision's text.
+        @fread/digest <on|off> - Instead of a message for every new post, receive a
+            periodic summary of new posts on the boards you follow.
     """
     key = '@fread'
     aliases = ['+bbread']
-    switch_options = ('catchup', 'scan', 'next', 'new')
+    switch_options = ('catchup', 'scan', 'next', 'new', 'recent', 'digest', 'history', 'find')
 
     def switch_main(self):
+        render = self.controller.render_deferred
         if not self.args:
-            return self.msg(self.controller.render_board_list(self.session))
+            return render(self.session, self.controller.render_board_list, self.session)
         if '/' not in self.args:
-            return self.msg(self.controller.render_board(self.session, self.args))
+            return render(self.session, self.controller.render_board, self.session, self.args)
         board, posts = self.args.split('/', 1)
-        return self.msg(self.controller.display_posts(self.session, board, posts))
+        self.controller.display_posts(self.session, board, posts)
+
+    def switch_recent(self):
+        self.msg(self.controller.render_recent(self.session, self.lhs, self.rhs))
+
+    def switch_find(self):
+        if self.rhs:
+            return self.msg(self.controller.render_find(self.session, self.rhs, self.lhs))
+        self.msg(self.controller.render_find(self.session, self.args))
+
+    def switch_history(self):
+        if '/' not in self.lhs:
+            raise ValueError("Usage: @fread/history <board>/<thread>[=<revision>]")
+        board, post = self.lhs.split('/', 1)
+        self.msg(self.controller.render_history(self.session, board, post, self.rhs))
+
+    def switch_digest(self):
+        if self.args.lower() not in ('on', 'off'):
+            raise ValueError("Usage: @fread/digest <on|off>")
+        enabled = self.args.lower() == 'on'
+        self.controller.set_digest(self.session, enabled)
+        self.msg(f"BBS digests are now {'enabled' if enabled else 'disabled'}.")
 
     def switch_catchup(self):
         if not self.args:
@@ -275,17 +323,19 @@ class CmdBBSRead(BBSCommand):
             unread = board.unread_posts(self.account)
             for post in unread:
                 post.update_read(self.account)
+            pin_primary(self.session.uid)
             self.msg(f"Skipped {len(unread)} posts on Board '{board.prefix_order} - {board.key}'")
 
     def switch_scan(self):
-        boards = self.controller.visible_boards(self.caller, check_admin=True)
         unread = dict()
         show_boards = list()
-        for board in boards:
-            b_unread = board.unread_posts(self.account)
-            if b_unread:
-                show_boards.append(board)
-                unread[board] = b_unread
+        with use_replica(self.session.uid):
+            boards = self.controller.visible_boards(self.caller, check_admin=True)
+            for board in boards:
+                b_unread = list(board.unread_posts(self.account))
+                if b_unread:
+                    show_boards.append(board)
+                    unread[board] = b_unread
         if not show_boards:
             raise ValueError("No unread posts to scan for!")
         this_cat = None
@@ -304,13 +354,15 @@ class CmdBBSRead(BBSCommand):
         return '\n'.join(str(l) for l in message)
 
     def switch_next(self):
-        boards = self.controller.visible_boards(self.caller, check_admin=True)
-        for board in boards:
-            b_unread = board.unread_posts(self.account).first()
-            if b_unread:
-                self.render_post(b_unread)
-                b_unread.update_read(self.account)
-                return
+        with use_replica(self.session.uid):
+            boards = self.controller.visible_boards(self.caller, check_admin=True)
+            for board in boards:
+                b_unread = board.unread_posts(self.account).first()
+                if b_unread:
+                    self.render_post(b_unread)
+                    b_unread.update_read(self.account)
+                    pin_primary(self.session.uid)
+                    return
         raise ValueError("No unread posts to scan for!")
 
     def switch_new(self):
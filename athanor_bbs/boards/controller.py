@@ -1,18 +1,187 @@
-from evennia.utils.ansi import ANSIString
+import math
+import re
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Count, Case, When, Value, PositiveIntegerField
+from twisted.internet import reactor
+from twisted.internet.task import LoopingCall
+from twisted.internet.threads import deferToThread, deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+
+from evennia.server.models import ServerConfig
+from evennia.utils import logger
 
 from athanor.utils.controllers import AthanorController, AthanorControllerBackend
+from athanor.utils.online import puppets as online_puppets
+from athanor.utils.time import utcnow
 
-from athanor_bbs.boards.models import BoardTopic, BoardPost, BoardACL, TopicRead
+from athanor_bbs.boards.models import BoardDB, BoardTopic, BoardPost, BoardACL, TopicRead, BoardDigest
 from athanor_bbs.boards.boards import DefaultBoard
 from athanor_bbs.boards import messages as fmsg
+from athanor_bbs.boards.membership import IGNORES
+from athanor_bbs.boards.layout import RowLayout, DATES, fit, ansi_cell
+from athanor_bbs.boards.pager import PostPager
+from athanor_bbs.boards.registry import BOARDS
+from athanor_bbs.boards.revisions import reconstruct
+from athanor_bbs.boards.routers import read_only, pin_primary
+from athanor_bbs.boards.search import TrigramIndex, BOARD_NAMES, TOPIC_NAMES
+from athanor_bbs.boards.stats import STATS
+from athanor_bbs.boards.throttle import FloodControl
+from athanor_bbs.boards.utils import make_cursor, parse_cursor
 
 
 class AthanorBoardController(AthanorController):
     system_name = 'FORUM'
+    category_row = RowLayout((7, '<'), (27, '<'))
+    board_row = RowLayout((6, '<'), (31, '<'), (4, '<'))
+    post_row = RowLayout((10, '<'), (3, '<'), (34, '<'))
+    re_alias = re.compile(r"(?i)^[A-Z]+\d+$")
+    # Name matches scoring within this much of the best match are too close to pick between.
+    fuzzy_margin = 0.15
+    # Topics renumbered per UPDATE by move_posts. Each costs about three SQL parameters, and SQLite
+    # builds before 3.32 allow only 999.
+    renumber_batch = 250
+    # Best name matches looked up by find_topics(), before filtering by board. Results show far fewer.
+    find_candidates = 250
 
     def __init__(self, key, manager, backend):
         super().__init__(key, manager, backend)
+        self.digests = None
+        self.digest_task = LoopingCall(self.run_digests)
+        self.digest_task.start(settings.BBS_DIGEST_INTERVAL, now=False)\
+            .addErrback(lambda failure: logger.log_trace(f"BBS digest task stopped: {failure.getTraceback()}"))
+        self.render_pool = None
+        self.render_jobs = defaultdict(int)
+        self.flood_identity = FloodControl(*settings.BBS_FLOOD_IDENTITY)
+        self.flood_board = FloodControl(*settings.BBS_FLOOD_BOARD)
+        reactor.callWhenRunning(self.warm_up)
+        reactor.addSystemEventTrigger('before', 'shutdown', self.save_flood)
+
+    def warm_up(self):
+        """
+        Loads the controller and fills its caches once the server is running. The database reads happen
+        in a background thread; the results are only installed back on the reactor thread, replaying any
+        changes made in the meantime. Until then, lookups fall back to querying the database directly.
+        """
+        self.backend.load()
         self.load()
+        self.load_flood()
+        started = time.perf_counter()
+        for index in (BOARDS, BOARD_NAMES, TOPIC_NAMES, IGNORES):
+            index.begin_load()
+        deferred = deferToThread(self._warm_caches)
+        deferred.addCallback(self._warmed, started)
+        deferred.addErrback(self._warm_failed)
+        return deferred
+
+    def _warm_caches(self):
+        try:
+            boards = list(self.backend.all().prefetch_related('acl_entries'))
+            board_names = TrigramIndex.build((board.pk, board.db_key) for board in boards)
+            topic_names = TrigramIndex.build(BoardTopic.objects.values_list('id', 'db_name').iterator())
+            ignored = IGNORES.fetch()
+            digests = self.fetch_digests()
+        finally:
+            close_old_connections()
+        return boards, board_names, topic_names, ignored, digests
+
+    def _warmed(self, fetched, started):
+        boards, board_names, topic_names, ignored, digests = fetched
+        BOARDS.install(boards)
+        BOARD_NAMES.install(board_names)
+        TOPIC_NAMES.install(topic_names)
+        IGNORES.install(ignored)
+        if self.digests is None:
+            self.digests = digests
+        logger.log_info(f"BBS caches warmed in {time.perf_counter() - started:.3f}s ({len(boards)} boards).")
+
+    def _warm_failed(self, failure):
+        for index in (BOARDS, BOARD_NAMES, TOPIC_NAMES, IGNORES):
+            index.abort_load()
+        logger.log_trace(f"BBS cache warm-up failed: {failure.getTraceback()}")
+
+    def load_flood(self):
+        if (saved := ServerConfig.objects.conf('bbs_flood_control', default=None)):
+            self.flood_identity.restore(saved.get('identity', dict()))
+            self.flood_board.restore(saved.get('board', dict()))
+
+    def save_flood(self):
+        now = time.time()
+        ServerConfig.objects.conf('bbs_flood_control', value={'identity': self.flood_identity.export(now),
+                                                              'board': self.flood_board.export(now)})
+
+    def flood_exempt(self, enactor):
+        return enactor.locks.check_lockstring(enactor, settings.BBS_FLOOD_EXEMPT_LOCK)
+
+    def check_flood(self, enactor, board):
+        """
+        Raises ValueError if the enactor's or the board's bucket is empty. Anyone passing
+        BBS_FLOOD_EXEMPT_LOCK is never throttled. Tokens are only taken by spend_flood(), once the
+        action has succeeded.
+        """
+        if self.flood_exempt(enactor):
+            return
+        now = time.time()
+        if (wait := self.flood_identity.wait(enactor.pk, now)):
+            raise ValueError(f"You are posting too quickly. Please wait {math.ceil(wait)} more seconds.")
+        if (wait := self.flood_board.wait(board.pk, now)):
+            raise ValueError(f"{board.prefix_order} is receiving too many posts. "
+                             f"Please wait {math.ceil(wait)} more seconds.")
+
+    def spend_flood(self, enactor, board):
+        if self.flood_exempt(enactor):
+            return
+        now = time.time()
+        self.flood_identity.consume(enactor.pk, now)
+        self.flood_board.consume(board.pk, now)
+
+    def start_render_pool(self):
+        self.render_pool = ThreadPool(minthreads=0, maxthreads=settings.BBS_RENDER_THREADS, name='bbs_render')
+        self.render_pool.start()
+        reactor.addSystemEventTrigger('before', 'shutdown', self.render_pool.stop)
+
+    def render_deferred(self, session, renderer, *args, **kwargs):
+        """
+        Calls renderer(*args, **kwargs) on the BBS render thread pool instead of the reactor thread,
+        and sends its output to <session> once it's done.
+
+        Each session may only have BBS_RENDER_JOBS_PER_SESSION renders queued or running at once.
+        """
+        if self.render_jobs[session.sessid] >= settings.BBS_RENDER_JOBS_PER_SESSION:
+            raise ValueError("You already have BBS requests in progress. Please wait for them to finish.")
+        if self.render_pool is None:
+            self.start_render_pool()
+        if not IGNORES.loaded:
+            # Renderers read the ignore index from the pool; only the reactor thread may fill it.
+            IGNORES.load()
+        self.render_jobs[session.sessid] += 1
+        deferred = deferToThreadPool(reactor, self.render_pool, self._render_in_thread, renderer, *args, **kwargs)
+        deferred.addCallback(session.msg)
+        deferred.addErrback(self._render_failed, session)
+        deferred.addBoth(self._render_finished, session)
+        return deferred
+
+    def _render_in_thread(self, renderer, *args, **kwargs):
+        try:
+            return renderer(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    def _render_failed(self, failure, session):
+        if failure.check(ValueError):
+            session.msg(str(failure.value), system_alert=self.system_name)
+            return
+        logger.log_trace(failure.getTraceback())
+        session.msg("An error occurred. Please contact staff!", system_alert=self.system_name)
+
+    def _render_finished(self, result, session):
+        if (remaining := self.render_jobs[session.sessid] - 1) > 0:
+            self.render_jobs[session.sessid] = remaining
+        else:
+            del self.render_jobs[session.sessid]
 
     def create_board(self, session, owner, name, order: int=0):
         pass
@@ -36,9 +205,13 @@ class AthanorBoardController(AthanorController):
         return board.lock(session, new_locks)
 
     def all(self):
+        if BOARDS.loaded:
+            return BOARDS.all()
         return self.backend.all()
 
     def count(self):
+        if BOARDS.loaded:
+            return len(BOARDS.boards)
         return self.backend.count()
 
     def visible_boards(self, user):
@@ -49,6 +222,10 @@ class AthanorBoardController(AthanorController):
             raise ValueError("No board entered to find!")
         if isinstance(find_name, DefaultBoard):
             return find_name
+        if BOARDS.loaded:
+            if not (found := BOARDS.by_alias(find_name)) or not found.check_acl(user, 'read'):
+                raise ValueError("Board '%s' not found!" % find_name)
+            return found
         if not (boards := self.visible_boards(user)):
             raise ValueError("No applicable BBS Boards.")
         board_dict = {board.prefix_order.upper(): board for board in boards}
@@ -56,6 +233,69 @@ class AthanorBoardController(AthanorController):
             raise ValueError("Board '%s' not found!" % find_name)
         return found
 
+    def find_board_by_name(self, user, find_name=None):
+        """
+        For read-only commands only: like find_board(), but also accepts a board's name, or part of it,
+        as long as exactly one visible board is a close match. Anything shaped like an ID must match exactly.
+        """
+        try:
+            return self.find_board(user, find_name)
+        except ValueError:
+            if isinstance(find_name, DefaultBoard) or not BOARDS.loaded or self.re_alias.match(find_name.strip()):
+                raise
+        candidates = [(score, board) for score, board_id in BOARD_NAMES.matches(find_name)
+                      if (board := BOARDS.get(board_id)) and board.check_acl(user, 'read')]
+        if not candidates:
+            raise ValueError("Board '%s' not found!" % find_name)
+        if len(exact := [board for score, board in candidates if board.key.lower() == find_name.strip().lower()]) == 1:
+            return exact[0]
+        close = [board for score, board in candidates if score >= candidates[0][0] - self.fuzzy_margin]
+        if len(close) > 1:
+            raise ValueError(f"'{find_name}' could mean any of: {', '.join(b.prefix_order for b in close)}. "
+                             f"Please use the board's ID.")
+        return close[0]
+
+    def find_topics(self, user, find_name=None, board=None):
+        """
+        Returns topics on visible boards (or only <board>) whose names fuzzily match <find_name>, best first.
+        """
+        if not find_name:
+            raise ValueError("No post entered to find!")
+        if not TOPIC_NAMES.loaded:
+            raise ValueError("The BBS is still loading. Please try again in a moment.")
+        if not (topic_ids := TOPIC_NAMES.search(find_name)[:self.find_candidates]):
+            return list()
+        boards = [self.find_board_by_name(user, board)] if board else self.visible_boards(user)
+        found = BoardTopic.objects.filter(id__in=topic_ids, db_board__in=boards).select_related('db_board').in_bulk()
+        return [found[topic_id] for topic_id in topic_ids if topic_id in found]
+
+    def config_board(self, session, board, option=None, value=None):
+        enactor = self._enactor(session)
+        board = self.find_board(enactor, board)
+        if not board.check_permission(enactor, mode='admin'):
+            raise ValueError("Permission denied!")
+        option, value = board.change_config(option, value)
+        entities = {'enactor': enactor, 'target': board}
+        fmsg.Config(entities, config_op=option, config_val=value).send()
+
+    def join_board(self, session, board):
+        enactor = self._enactor(session)
+        board = self.find_board(enactor, board)
+        if not IGNORES.is_ignoring(enactor, board):
+            raise ValueError(f"You are already a member of {board.prefix_order}!")
+        IGNORES.unignore(enactor, board)
+        return board
+
+    def leave_board(self, session, board):
+        enactor = self._enactor(session)
+        board = self.find_board(enactor, board)
+        if board.mandatory:
+            raise ValueError("Cannot leave mandatory bbs!")
+        if IGNORES.is_ignoring(enactor, board):
+            raise ValueError(f"You are not a member of {board.prefix_order}!")
+        IGNORES.ignore(enactor, board)
+        return board
+
     def delete_board(self, session, board, verify):
         enactor = self._enactor(session)
         board = self.find_board(enactor, board)
@@ -71,21 +311,152 @@ class AthanorBoardController(AthanorController):
             raise ValueError("Posts must have a subject!")
         if not text:
             raise ValueError("Posts must have a text body!")
+        self.check_flood(enactor, board)
         new_post = board.create_post(session.account, enactor, subject, text, date=date)
+        self.spend_flood(enactor, board)
+        pin_primary(session.uid)
         if announce:
-            entities = {'enactor': enactor, 'target': board, 'post': new_post}
-            pass  # do something!
+            self.announce_post(enactor, board, new_post)
         return new_post
 
+    def announce_post(self, enactor, board, post):
+        """
+        Notifies every listener of a new post, except digest subscribers, who hear about it in their next digest.
+        """
+        digests = self.load_digests()
+        text = f"New BBS post by {enactor} on {board.prefix_order}: ({post.post_alias()}) {post}"
+        for listener in board.listeners():
+            if listener.pk not in digests:
+                listener.msg(text, system_alert=self.system_name)
+
+    def fetch_digests(self):
+        return {digest.identity_id: digest for digest in BoardDigest.objects.all()}
+
+    def load_digests(self):
+        if self.digests is None:
+            self.digests = self.fetch_digests()
+        return self.digests
+
+    def set_digest(self, session, enabled=True):
+        enactor = self._enactor(session)
+        digests = self.load_digests()
+        if enabled:
+            if enactor.pk in digests:
+                raise ValueError("You are already receiving BBS digests!")
+            digests[enactor.pk] = BoardDigest.objects.create(identity=enactor, date_last_sent=utcnow())
+        else:
+            if not (digest := digests.pop(enactor.pk, None)):
+                raise ValueError("You are not receiving BBS digests!")
+            digest.delete()
+
+    def render_digest(self, identity, since):
+        """
+        Summarizes posts made since <since> on the boards <identity> follows, or returns None if there are none.
+        """
+        ignored = IGNORES.boards_for(identity)
+        boards = {board.pk: board for board in self.visible_boards(identity) if board.pk not in ignored}
+        counts = BoardPost.objects.filter(db_topic__db_board__in=boards.keys(), db_date_created__gt=since)\
+            .values_list('db_topic__db_board').annotate(total=Count('id')).order_by('db_topic__db_board')
+        counts = [(boards[board_id], total) for board_id, total in counts]
+        if not counts:
+            return None
+        total = sum(count for board, count in counts)
+        details = ', '.join(f"{board.prefix_order} ({count})" for board, count in counts)
+        return f"BBS Digest: {total} new posts on {len(counts)} boards: {details}"
+
+    def run_digests(self):
+        """
+        Called by the digest task. Errors are logged rather than raised, since raising would stop the task.
+        """
+        try:
+            self.deliver_digests()
+        except Exception:
+            logger.log_trace("Error while delivering BBS digests.")
+
+    def deliver_digests(self):
+        """
+        Sends each online digest subscriber one summary of everything posted since their last digest.
+
+        Subscribers who were offline accumulate posts until the first run after they log back in.
+        """
+        digests = self.load_digests()
+        if not digests:
+            return
+        now = utcnow()
+        for character in online_puppets():
+            if not (digest := digests.get(character.pk, None)):
+                continue
+            if (text := self.render_digest(character, digest.date_last_sent)):
+                character.msg(text, system_alert=self.system_name)
+            digest.date_last_sent = now
+            digest.save(update_fields=['date_last_sent'])
+
     def rename_post(self, session, board=None, post=None, new_name=None):
         enactor = self._enactor(session)
         board = self.find_board(enactor, board)
         post = board.find_post(enactor, post)
 
-    def delete_post(self, session, board=None, post=None, name_confirm=None):
+    def _flush_topics(self, topic_ids):
+        for topic_id in topic_ids:
+            if (cached := BoardTopic.get_cached_instance(topic_id)):
+                BoardTopic.flush_cached_instance(cached, force=True)
+
+    def move_posts(self, session, board=None, posts=None, destination=None):
+        """
+        Moves a range of posts to the end of another board in one transaction, numbering them
+        consecutively from the destination's next post number. Their read state moves with them.
+        """
         enactor = self._enactor(session)
         board = self.find_board(enactor, board)
-        post = board.find_post(enactor, post)
+        destination = self.find_board(enactor, destination)
+        if board == destination:
+            raise ValueError("Posts are already on that board!")
+        if not board.check_permission(enactor, mode='admin') or \
+                not destination.check_permission(enactor, mode='post'):
+            raise ValueError("Permission denied!")
+        orders = board.parse_ordernums(enactor, posts)
+        with transaction.atomic():
+            topics = BoardTopic.objects.filter(db_board=board, db_order__in=orders)
+            topic_ids = list(topics.order_by('db_order').values_list('id', flat=True))
+            if not topic_ids:
+                raise ValueError("posts not found!")
+            start = BoardDB.objects.select_for_update().values_list('db_next_post_number', flat=True)\
+                .get(id=destination.id)
+            for offset in range(0, len(topic_ids), self.renumber_batch):
+                batch = topic_ids[offset:offset + self.renumber_batch]
+                renumber = Case(*[When(id=topic_id, then=Value(start + offset + i))
+                                  for i, topic_id in enumerate(batch)], output_field=PositiveIntegerField())
+                BoardTopic.objects.filter(id__in=batch).update(db_board=destination, db_order=renumber)
+            BoardDB.objects.filter(id=destination.id)\
+                .update(db_next_post_number=F('db_next_post_number') + len(topic_ids))
+        destination.db_next_post_number = start + len(topic_ids)
+        self._flush_topics(topic_ids)
+        pin_primary(session.uid)
+        return board, destination, len(topic_ids)
+
+    def delete_posts(self, session, board=None, posts=None, verify=None):
+        """
+        Deletes a range of posts, with their replies and read state, in one transaction.
+        <verify> must repeat the range exactly.
+        """
+        enactor = self._enactor(session)
+        board = self.find_board(enactor, board)
+        if not board.check_permission(enactor, mode='admin'):
+            raise ValueError("Permission denied!")
+        if not posts or verify != posts:
+            raise ValueError("You must repeat the posts to delete, to verify!")
+        orders = board.parse_ordernums(enactor, posts)
+        with transaction.atomic():
+            topics = BoardTopic.objects.filter(db_board=board, db_order__in=orders)
+            topic_ids = list(topics.values_list('id', flat=True))
+            if not topic_ids:
+                raise ValueError("posts not found!")
+            BoardTopic.objects.filter(id__in=topic_ids).delete()
+        for topic_id in topic_ids:
+            TOPIC_NAMES.remove(topic_id)
+        self._flush_topics(topic_ids)
+        pin_primary(session.uid)
+        return board, len(topic_ids)
 
     def edit_post(self, session, board=None, post=None, seek_text=None, replace_text=None):
         enactor = self._enactor(session)
@@ -93,13 +464,14 @@ class AthanorBoardController(AthanorController):
         post = board.find_post(enactor, post)
         if not post.can_edit(enactor):
             raise ValueError("Permission denied.")
-        post.edit_post(find=seek_text, replace=replace_text)
+        self.check_flood(enactor, board)
+        post.edit_post(enactor, find=seek_text, replace=replace_text)
+        self.spend_flood(enactor, board)
+        pin_primary(session.uid)
 
     def render_category_row(self, category):
         bri = category.bridge
-        cabbr = ANSIString(bri.cabbr)
-        cname = ANSIString(bri.cname)
-        return f"{cabbr:<7}{cname:<27}{bri.boards.count():<7}{str(category.locks):<30}"
+        return f"{self.category_row.row(bri.cabbr, bri.cname)}{bri.boards.count():<7}{str(category.locks):<30}"
 
     def render_category_list(self, session):
         enactor = self._enactor(session)
@@ -120,15 +492,16 @@ class AthanorBoardController(AthanorController):
 
     def render_board_row(self, enactor, account, board):
         bri = board.bridge
-        if board.db.mandatory:
+        if board.mandatory:
             member = 'MND'
         else:
-            member = 'No' if account in board.ignore_list else 'Yes'
+            member = 'No' if IGNORES.is_ignoring(enactor, board) else 'Yes'
         count = bri.posts.count()
         unread = board.unread_posts(account).count()
         perms = board.display_permissions(enactor)
-        return f"{board.prefix_order:<6}{board.key:<31}{member:<4} {count:>5} {unread:>5} {perms}"
+        return f"{self.board_row.row(board.prefix_order, board.key, member)} {count:>5} {unread:>5} {perms}"
 
+    @read_only
     def render_board_list(self, session):
         enactor = self._enactor(session)
         boards = self.visible_boards(enactor)
@@ -141,13 +514,15 @@ class AthanorBoardController(AthanorController):
         for board in boards:
             if this_cat != (this_cat := board.category):
                 message.append(styling.styled_separator(this_cat.cname))
-            message.append(self.render_board_row(enactor, session.account, board))
+            with STATS.timer('board_list_row'):
+                message.append(self.render_board_row(enactor, session.account, board))
         message.append(styling.blank_footer)
         return '\n'.join(str(l) for l in message)
 
+    @read_only
     def render_board(self, session, board):
         enactor = self._enactor(session)
-        board = self.find_board(enactor, board)
+        board = self.find_board_by_name(enactor, board)
         posts = board.posts.order_by('order')
         styling = enactor.styler
         message = list()
@@ -158,10 +533,113 @@ class AthanorBoardController(AthanorController):
         for post in posts:
             id = f"{post.board.db_script.prefix_order}/{post.order}"
             rd = 'U ' if post in unread else ''
-            subject = post.cname[:34].ljust(34)
-            post_date = styling.localize_timestring(post.date_created, time_format='%b %d %Y')
+            post_date = DATES.format(styling, post.date_created)
             author = post.character if post.character else 'N/A'
-            message.append(f"{id:<10}{rd:<3}{subject:<35}{post_date:<12}{author}")
+            message.append(f"{self.post_row.row(id, rd, post.cname)} {post_date:<12}{author}")
+        message.append(styling.blank_footer)
+        return '\n'.join(str(l) for l in message)
+
+    def recent_topics(self, user, board=None, cursor=None):
+        """
+        Returns a page of topics ordered by latest activity, and the cursor for the next page (or None).
+
+        Pages are keyset-paginated on (db_date_latest, id), so deep pages cost the same as the first.
+        """
+        before = parse_cursor(cursor) if cursor else None
+        if board:
+            board = self.find_board_by_name(user, board)
+            topics = BoardTopic.recent(board, before=before)
+            limit = board.posts_per_page()
+        else:
+            hidden = [found.pk for found in self.all() if not found.check_acl(user, 'read')]
+            topics = BoardTopic.recent(hidden=hidden, before=before)
+            limit = settings.BBS_PAGE_SIZE
+        topics = list(topics.select_related('db_board')[:limit + 1])
+        if len(topics) <= limit:
+            return topics, None
+        topics = topics[:limit]
+        return topics, make_cursor(topics[-1].db_date_latest, topics[-1].id)
+
+    @read_only
+    def render_recent(self, session, board=None, cursor=None):
+        enactor = self._enactor(session)
+        topics, next_cursor = self.recent_topics(enactor, board, cursor)
+        styling = enactor.styler
+        message = list()
+        message.append(styling.styled_header('BBS Recent Activity'))
+        message.append(styling.styled_columns(f"{'ID':<10}{'Title':<35}{'Latest':<12}Board"))
+        message.append(styling.blank_separator)
+        for topic in topics:
+            subject = fit(topic.db_cname, 34)
+            latest = DATES.format(styling, topic.db_date_latest)
+            message.append(f"{topic.post_alias():<10}{subject} {latest:<12}{topic.db_board.key}")
+        if next_cursor:
+            message.append(styling.styled_footer(f"More: @fread/recent {board or ''}={next_cursor}"))
+        else:
+            message.append(styling.blank_footer)
+        return '\n'.join(str(l) for l in message)
+
+    def render_stats(self, session):
+        enactor = self._enactor(session)
+        if not enactor.locks.check_lockstring(enactor, 'dummy:perm(Admin)'):
+            raise ValueError("Permission denied!")
+        styling = enactor.styler
+        message = list()
+        message.append(styling.styled_header('BBS Statistics'))
+        message.append(styling.styled_columns(f"{'Timer':<30}{'Calls':>10}{'Avg (us)':>12}"))
+        for name, (calls, total) in sorted(STATS.timings.items()):
+            message.append(f"{name:<30}{calls:>10}{total / calls * 1000000:>12.1f}")
+        message.append(styling.styled_columns(f"{'Cache':<30}{'Hits':>10}{'Hit Rate':>12}"))
+        for name, cache in (('ansi_cell', ansi_cell), ('fit', fit)):
+            info = cache.cache_info()
+            rate = info.hits / (info.hits + info.misses) if info.hits + info.misses else 0.0
+            message.append(f"{name:<30}{info.hits:>10}{rate:>12.1%}")
+        hits, rate = STATS.hit_rate('date_format')
+        message.append(f"{'date_format':<30}{hits:>10}{rate:>12.1%}")
+        message.append(f"{'date_format_uncached':<30}{STATS.counters['date_format_uncached']:>10}")
+        message.append(styling.blank_footer)
+        return '\n'.join(str(l) for l in message)
+
+    @read_only
+    def render_find(self, session, find_name, board=None):
+        enactor = self._enactor(session)
+        if not (topics := self.find_topics(enactor, find_name, board)):
+            raise ValueError(f"No posts found matching '{find_name}'.")
+        styling = enactor.styler
+        message = list()
+        message.append(styling.styled_header(f"BBS Posts matching '{find_name}'"))
+        message.append(styling.styled_columns(f"{'ID':<10}{'Title':<35}Board"))
+        message.append(styling.blank_separator)
+        for topic in topics[:settings.BBS_PAGE_SIZE]:
+            message.append(f"{topic.post_alias():<10}{fit(topic.db_cname, 34)} {topic.db_board.key}")
+        message.append(styling.blank_footer)
+        return '\n'.join(str(l) for l in message)
+
+    @read_only
+    def render_history(self, session, board, post, revision=None):
+        enactor = self._enactor(session)
+        board = self.find_board(enactor, board)
+        topic = board.find_post(enactor, post)
+        if not (post := topic.opening_post()):
+            raise ValueError("Post not found!")
+        styling = enactor.styler
+        message = list()
+        if revision:
+            try:
+                revision = int(revision)
+            except ValueError:
+                raise ValueError("Revisions must be chosen by number!")
+            message.append(styling.styled_header(f'BBS Post {topic.post_alias()} - Revision {revision}'))
+            message.append(reconstruct(post, revision))
+            message.append(styling.blank_footer)
+            return '\n'.join(str(l) for l in message)
+        revisions = post.revisions.select_related('editor').order_by('number').only('number', 'editor', 'date_created')
+        message.append(styling.styled_header(f'BBS Post {topic.post_alias()} - History'))
+        message.append(styling.styled_columns(f"{'Rev':<6}{'Date':<14}Editor"))
+        message.append(styling.blank_separator)
+        for rev in revisions:
+            rev_date = DATES.format(styling, rev.date_created)
+            message.append(f"{rev.number:<6}{rev_date:<14}{rev.editor if rev.editor else 'N/A'}")
         message.append(styling.blank_footer)
         return '\n'.join(str(l) for l in message)
 
@@ -170,24 +648,31 @@ class AthanorBoardController(AthanorController):
         message.append(styling.styled_header(f'BBS Post - {post.board.db_script.cname}'))
         msg = f"{post.board.db_script.prefix_order}/{post.order}"[:25].ljust(25)
         message.append(f"Message: {msg} Created       Author")
-        subj = post.cname[:34].ljust(34)
-        disp_time = styling.localize_timestring(post.date_created, time_format='%b %d %Y').ljust(13)
+        subj = fit(post.cname, 34)
+        disp_time = DATES.format(styling, post.date_created).ljust(13)
         message.append(f"{subj} {disp_time} {post.character if post.character else 'N/A'}")
         message.append(styling.blank_separator)
         message.append(post.body)
         message.append(styling.blank_separator)
         return '\n'.join(str(l) for l in message)
 
+    def iter_posts(self, session, enactor, styling, posts):
+        for post in posts:
+            yield self.render_post(session, enactor, styling, post)
+            post.update_read(session.account)
+        pin_primary(session.uid)
+
     def display_posts(self, session, board, posts):
+        """
+        Shows posts through a PostPager, which fetches and renders them one page at a time.
+        """
         enactor = self._enactor(session)
         board = self.find_board(enactor, board)
         posts = board.parse_postnums(enactor, posts)
-        message = list()
         styling = enactor.styler
-        for post in posts:
-            message.append(self.render_post(session, enactor, styling, post))
-            post.update_read(session.account)
-        return '\n'.join(str(l) for l in message)
+        return PostPager(session.get_puppet_or_account(), posts,
+                         lambda page: self.iter_posts(session, enactor, styling, page),
+                         per_page=settings.BBS_POSTS_PER_PAGE, session=session)
 
 
 class AthanorBoardControllerBackend(AthanorControllerBackend):
@@ -198,7 +683,6 @@ class AthanorBoardControllerBackend(AthanorControllerBackend):
     def __init__(self, frontend):
         super().__init__(frontend)
         self.board_typeclass = None
-        self.load()
 
     def all(self):
         return DefaultBoard.objects.all_family()
@@ -0,0 +1,118 @@
+import re
+from datetime import timedelta, timezone
+from functools import lru_cache
+
+from evennia.utils import logger
+from evennia.utils.ansi import ANSIString
+
+from athanor_bbs.boards.stats import STATS
+
+# strftime directives finer than a day, or naming the zone. Formats using them are not memoized.
+_TIME_DIRECTIVES = re.compile(r"%[-#]?[HIklMpSfsXcZzrRT]")
+
+
+@lru_cache(maxsize=4096)
+def ansi_cell(text):
+    """
+    Parses <text> once, returning (ANSIString, display width). Names are cached by their text,
+    so a renamed board or topic simply gets a new entry.
+    """
+    ansi = ANSIString(text)
+    return ansi, len(ansi)
+
+
+@lru_cache(maxsize=8192)
+def fit(text, width, align='<'):
+    """
+    Returns <text> truncated or padded to <width> visible characters, with its ANSI codes intact.
+    """
+    ansi, length = ansi_cell(text)
+    if length > width:
+        return str(ansi[:width])
+    fill = ' ' * (width - length)
+    return f"{ansi}{fill}" if align == '<' else f"{fill}{ansi}"
+
+
+class RowLayout:
+    """
+    Fixed-width columns, given as (width, align) pairs, filled from cached fit() pieces.
+    """
+
+    def __init__(self, *columns):
+        self.columns = columns
+
+    def row(self, *values):
+        return ''.join(fit(str(value), width, align) for value, (width, align) in zip(values, self.columns))
+
+
+class DateFormatCache:
+    """
+    Replaces styling.localize_timestring() for date-only formats with arithmetic.
+
+    For each (timezone, UTC day) it asks the timezone once for its UTC offset, and for the instant that
+    offset changes if a DST transition falls in that day. Any time that day is then localized by adding
+    the right offset, and formatted strings are shared by (local date, format). The cache is keyed by the
+    styler's timezone, so everyone in a zone shares it. See zone() for stylers without one.
+    """
+
+    def __init__(self, maxsize=8192):
+        self.maxsize = maxsize
+        self.days = dict()
+        self.strings = dict()
+        self.warned = set()
+
+    def zone(self, styling):
+        """
+        Returns the tzinfo <styling> localizes into, which must be its 'timezone' attribute, or None.
+        A styler class with no such attribute can never be cached, so that is logged once per class;
+        every uncached call is counted as date_format_uncached, shown by @fboard/stats.
+        """
+        if (tz := getattr(styling, 'timezone', None)) is None:
+            STATS.incr('date_format_uncached')
+            if not hasattr(styling, 'timezone') and type(styling) not in self.warned:
+                self.warned.add(type(styling))
+                logger.log_warn(f"BBS date cache: {type(styling).__name__} has no 'timezone' attribute, "
+                                f"so its dates are never cached.")
+        return tz
+
+    @staticmethod
+    def day_offsets(tz, day_start):
+        """
+        Returns (offset at <day_start>, the first instant of the day with a different offset or None,
+        offset at the end of the day). Assumes at most one transition per day.
+        """
+        day_end = day_start + timedelta(days=1) - timedelta(seconds=1)
+        first, last = day_start.astimezone(tz).utcoffset(), day_end.astimezone(tz).utcoffset()
+        if first == last:
+            return first, None, last
+        low, high = 0, 86399
+        while low < high:
+            middle = (low + high) // 2
+            if (day_start + timedelta(seconds=middle)).astimezone(tz).utcoffset() == first:
+                low = middle + 1
+            else:
+                high = middle
+        return first, day_start + timedelta(seconds=low), last
+
+    def format(self, styling, date, time_format='%b %d %Y'):
+        if _TIME_DIRECTIVES.search(time_format) or (tz := self.zone(styling)) is None:
+            return styling.localize_timestring(date, time_format=time_format)
+        date = date.astimezone(timezone.utc) if date.tzinfo else date.replace(tzinfo=timezone.utc)
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if (offsets := self.days.get((tz, day_start), None)) is None:
+            if len(self.days) >= self.maxsize:
+                self.days.clear()
+            offsets = self.days[(tz, day_start)] = self.day_offsets(tz, day_start)
+        first, transition, last = offsets
+        local_day = (date + (last if transition and date >= transition else first)).date()
+        if (found := self.strings.get((local_day, time_format), None)) is not None:
+            STATS.incr('date_format_hits')
+            return found
+        STATS.incr('date_format_misses')
+        if len(self.strings) >= self.maxsize:
+            self.strings.clear()
+        found = self.strings[(local_day, time_format)] = local_day.strftime(time_format)
+        return found
+
+
+DATES = DateFormatCache()
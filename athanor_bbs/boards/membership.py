@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from twisted.python.threadable import isInIOThread
+
+from athanor_bbs.boards.models import BoardDB
+from athanor_bbs.boards.utils import DeferredLoad
+
+
+class IgnoreIndex(DeferredLoad):
+    """
+    Process-wide mirror of the BoardDB.ignoring table, as a set of ignored board ids per identity id.
+
+    It is loaded from the database once, either by the board controller's warm-up or on first use from
+    the reactor thread, and must be kept coherent by calling ignore()/unignore() whenever the table is changed. After that,
+    membership checks never touch SQL.
+    """
+
+    def __init__(self):
+        self.ignored = defaultdict(set)
+        self.loaded = False
+
+    @staticmethod
+    def fetch():
+        """
+        Reads the table into a new mapping without touching the index, so it is safe to call from a thread.
+        """
+        ignored = defaultdict(set)
+        for board_id, identity_id in BoardDB.ignoring.through.objects.values_list('boarddb_id', 'identitydb_id'):
+            ignored[identity_id].add(board_id)
+        return ignored
+
+    def replace(self, ignored):
+        self.ignored = ignored
+        self.loaded = True
+
+    def load(self):
+        self.replace(self.fetch())
+
+    def boards_for(self, identity):
+        if not self.loaded:
+            if not isInIOThread():
+                # Worker threads must not fill the shared index, so they ask the database instead.
+                return frozenset(BoardDB.ignoring.through.objects.filter(identitydb_id=identity.pk)
+                                 .values_list('boarddb_id', flat=True))
+            self.load()
+        return self.ignored.get(identity.pk, frozenset())
+
+    def is_ignoring(self, identity, board):
+        return board.pk in self.boards_for(identity)
+
+    def ignore(self, identity, board):
+        board.ignoring.add(identity)
+        self._add(identity.pk, board.pk)
+
+    def unignore(self, identity, board):
+        board.ignoring.remove(identity)
+        self._discard(identity.pk, board.pk)
+
+    def _add(self, identity_id, board_id):
+        if self.defer(self._add, identity_id, board_id) or not self.loaded:
+            return
+        self.ignored[identity_id].add(board_id)
+
+    def _discard(self, identity_id, board_id):
+        if self.defer(self._discard, identity_id, board_id) or not self.loaded:
+            return
+        self.ignored[identity_id].discard(board_id)
+
+    def forget_board(self, board_id):
+        if self.defer(self.forget_board, board_id) or not self.loaded:
+            return
+        for boards in self.ignored.values():
+            boards.discard(board_id)
+
+
+IGNORES = IgnoreIndex()
@@ -1,9 +1,122 @@
+from string import Formatter
+
 from athanor.utils.message import AdminMessage
+from athanor.utils.online import puppets as online_puppets
+
+
+class MessageTemplate:
+    """
+    A format string parsed once into literal text and replacement fields.
+
+    prepare() renders every field that doesn't depend on the viewer, leaving a short list of
+    literal strings and per-viewer fields which render() splices together for each recipient.
+    """
+    formatter = Formatter()
+
+    def __init__(self, template):
+        self.pieces = list(self.formatter.parse(template))
+
+    @classmethod
+    def render_field(cls, substitutions, field, spec, conversion):
+        value, used_key = cls.formatter.get_field(field, (), substitutions)
+        value = cls.formatter.convert_field(value, conversion)
+        return cls.formatter.format_field(value, spec)
+
+    def prepare(self, substitutions, viewer_fields):
+        prepared = list()
+        literal = list()
+        for text, field, spec, conversion in self.pieces:
+            literal.append(text)
+            if field is None:
+                continue
+            if field.split('.', 1)[0].split('[', 1)[0] in viewer_fields:
+                prepared.append(''.join(literal))
+                literal.clear()
+                prepared.append((field, spec, conversion))
+            else:
+                literal.append(self.render_field(substitutions, field, spec, conversion))
+        prepared.append(''.join(literal))
+        return prepared
+
+    @classmethod
+    def render(cls, prepared, substitutions):
+        return ''.join(piece if isinstance(piece, str) else cls.render_field(substitutions, *piece)
+                       for piece in prepared)
 
 
 class BBSMessage(AdminMessage):
     system_name = "CHANNEL"
     targets = ['enactor', 'target', 'user', 'admin']
+    messages = dict()
+
+    # Substitutions which differ between recipients. Everything else is rendered once per event.
+    viewer_fields = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.templates = {key: MessageTemplate(template) for key, template in cls.messages.items()}
+
+    def __init__(self, entities, **kwargs):
+        super().__init__(entities, **kwargs)
+        self.bbs_entities = entities
+        self.bbs_variables = kwargs
+        self.shared_substitutions = None
+        self.prepared = dict()
+
+    def entity_substitutions(self, viewer, only=None):
+        substitutions = dict()
+        for name, entity in self.bbs_entities.items():
+            if not hasattr(entity, 'generate_substitutions'):
+                continue
+            for key, value in entity.generate_substitutions(viewer).items():
+                full_key = f"{name}_{key}"
+                if only is None or full_key in only:
+                    substitutions[full_key] = value
+        return substitutions
+
+    def render_message(self, target, viewer):
+        """
+        Formats the <target> template for one recipient. The viewer-independent text is
+        built on the first call for each template and re-used for every other recipient.
+        """
+        if (prepared := self.prepared.get(target, None)) is None:
+            if self.shared_substitutions is None:
+                self.shared_substitutions = self.entity_substitutions(None)
+                self.shared_substitutions.update(self.bbs_variables)
+            prepared = self.templates[target].prepare(self.shared_substitutions, self.viewer_fields)
+            self.prepared[target] = prepared
+        if len(prepared) == 1:
+            return prepared[0]
+        return MessageTemplate.render(prepared, self.entity_substitutions(viewer, only=self.viewer_fields))
+
+    def recipients(self, target):
+        """
+        Returns who should receive the <target> message. 'admin' means every online character who may
+        administrate the target board; any other target is the entity given under that name, if it can
+        receive messages.
+        """
+        if target == 'admin':
+            board = self.bbs_entities.get('target', None)
+            if hasattr(board, 'check_permission'):
+                return [char for char in online_puppets() if board.check_permission(char, mode='admin')]
+            return [char for char in online_puppets() if char.locks.check_lockstring(char, 'dummy:perm(Admin)')]
+        entity = self.bbs_entities.get(target, None)
+        return [entity] if hasattr(entity, 'msg') else list()
+
+    def send(self):
+        """
+        Delivers each template, in the order of self.targets, through render_message(). Anyone who
+        qualifies for more than one target only receives the first.
+        """
+        sent = set()
+        for target in self.targets:
+            if target not in self.templates:
+                continue
+            for viewer in self.recipients(target):
+                if viewer in sent:
+                    continue
+                sent.add(viewer)
+                viewer.msg(self.render_message(target, viewer), system_alert=self.system_name)
 
 
 class Create(BBSMessage):
@@ -40,9 +153,9 @@ class Lock(BBSMessage):
 
 class Config(BBSMessage):
     messages = {
-        'enactor': "Successfully re-configured {target_typename}: {target_fullname}. Set {config_op} to: {config_val}}",
-        'target': "|w{enactor_name}|n re-configured {target_typename}: {target_fullname}. Set {config_op} to: {config_val}}",
-        'admin': "|w{enactor_name}|n re-configured {target_typename}: {target_fullname}. Set {config_op} to: {config_val}}"
+        'enactor': "Successfully re-configured {target_typename}: {target_fullname}. Set {config_op} to: {config_val}",
+        'target': "|w{enactor_name}|n re-configured {target_typename}: {target_fullname}. Set {config_op} to: {config_val}",
+        'admin': "|w{enactor_name}|n re-configured {target_typename}: {target_fullname}. Set {config_op} to: {config_val}"
     }
 
 
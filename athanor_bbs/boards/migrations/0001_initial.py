@@ -0,0 +1,148 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('typeclasses', '0001_initial'),
+        ('identities', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BoardDB',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('db_key', models.CharField(db_index=True, max_length=255, verbose_name='key')),
+                ('db_typeclass_path', models.CharField(db_index=True, help_text="this defines what 'type' of entity this is. This variable holds a Python path to a module with a valid Evennia Typeclass.", max_length=255, null=True, verbose_name='typeclass')),
+                ('db_date_created', models.DateTimeField(auto_now_add=True, verbose_name='creation date')),
+                ('db_lock_storage', models.TextField(blank=True, help_text="locks limit access to an entity. A lock is defined as a 'lock string' on the form 'type:lockfunctions', defining what functionality is locked and how to determine access. Not defining a lock means no access is granted.", verbose_name='locks')),
+                ('db_order', models.PositiveIntegerField(default=0)),
+                ('db_ikey', models.CharField(max_length=255)),
+                ('db_ckey', models.CharField(max_length=255)),
+                ('db_next_post_number', models.PositiveIntegerField(default=0)),
+                ('db_mandatory', models.BooleanField(default=False)),
+                ('db_anonymous', models.BooleanField(default=False)),
+                ('db_retention', models.PositiveIntegerField(default=0)),
+                ('db_page_size', models.PositiveIntegerField(default=0)),
+                ('db_attributes', models.ManyToManyField(help_text='attributes on this object. An attribute can hold any pickle-able python object (see docs for special cases).', to='typeclasses.Attribute')),
+                ('db_identity', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='boards', to='identities.IdentityDB')),
+                ('db_tags', models.ManyToManyField(help_text='tags on this object. Tags are simple string markers to identify, group and alias objects.', to='typeclasses.Tag')),
+                ('ignoring', models.ManyToManyField(related_name='ignored_boards', to='identities.IdentityDB')),
+            ],
+            options={
+                'unique_together': {('db_identity', 'db_order'), ('db_identity', 'db_ikey')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DefaultBoard',
+            fields=[],
+            options={
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('boards.boarddb',),
+        ),
+        migrations.CreateModel(
+            name='BoardACL',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mode', models.CharField(max_length=255)),
+                ('identity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='identities.IdentityDB')),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='acl_entries', to='boards.BoardDB')),
+            ],
+            options={
+                'unique_together': {('resource', 'identity', 'mode')},
+            },
+        ),
+        migrations.CreateModel(
+            name='BoardTopic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('db_name', models.CharField(max_length=255)),
+                ('db_cname', models.CharField(max_length=255)),
+                ('db_date_created', models.DateTimeField()),
+                ('db_date_modified', models.DateTimeField()),
+                ('db_date_latest', models.DateTimeField()),
+                ('db_order', models.PositiveIntegerField()),
+                ('db_board', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='topics', to='boards.BoardDB')),
+                ('db_creator', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='bbs_topics', to='identities.IdentityDB')),
+            ],
+            options={
+                'verbose_name': 'Topics',
+                'verbose_name_plural': 'Topics',
+                'unique_together': {('db_board', 'db_order')},
+            },
+        ),
+        migrations.CreateModel(
+            name='BoardPost',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('db_name', models.CharField(max_length=255)),
+                ('db_cname', models.CharField(max_length=255)),
+                ('db_date_created', models.DateTimeField()),
+                ('db_date_modified', models.DateTimeField()),
+                ('db_order', models.PositiveIntegerField()),
+                ('db_body', models.TextField()),
+                ('db_cbody', models.TextField()),
+                ('db_author', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='bbs_posts', to='identities.IdentityDB')),
+                ('db_topic', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posts', to='boards.BoardTopic')),
+            ],
+            options={
+                'verbose_name': 'Post',
+                'verbose_name_plural': 'Posts',
+                'unique_together': {('db_topic', 'db_order')},
+            },
+        ),
+        migrations.CreateModel(
+            name='PostRevision',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveIntegerField()),
+                ('date_created', models.DateTimeField()),
+                ('snapshot', models.BooleanField(default=False)),
+                ('data', models.BinaryField()),
+                ('editor', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bbs_revisions', to='identities.IdentityDB')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revisions', to='boards.BoardPost')),
+            ],
+            options={
+                'unique_together': {('post', 'number')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TopicRead',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date_read', models.DateTimeField(null=True)),
+                ('identity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bbs_topic_read', to='identities.IdentityDB')),
+                ('topic', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='readers', to='boards.BoardTopic')),
+            ],
+            options={
+                'unique_together': {('identity', 'topic')},
+            },
+        ),
+        migrations.CreateModel(
+            name='BoardDigest',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date_last_sent', models.DateTimeField()),
+                ('identity', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='bbs_digest', to='identities.IdentityDB')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='boardtopic',
+            index=models.Index(fields=['db_board', '-db_date_latest', '-id'], name='boards_topic_board_latest'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtopic',
+            index=models.Index(fields=['-db_date_latest', '-id'], name='boards_topic_latest'),
+        ),
+        migrations.AddIndex(
+            model_name='boardpost',
+            index=models.Index(fields=['db_topic', 'db_date_created'], name='boards_post_topic_created'),
+        ),
+    ]
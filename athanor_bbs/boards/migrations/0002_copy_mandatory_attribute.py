@@ -0,0 +1,25 @@
+from django.db import migrations
+
+
+def copy_mandatory(apps, schema_editor):
+    """
+    Boards used to be made mandatory with the Attribute board.db.mandatory. Carry any set to a true
+    value over to the db_mandatory column, which is all that is read now.
+    """
+    BoardDB = apps.get_model('boards', 'BoardDB')
+    found = BoardDB.db_attributes.through.objects.filter(attribute__db_key='mandatory',
+                                                         attribute__db_category__isnull=True)
+    mandatory = [row.boarddb_id for row in found.select_related('attribute') if row.attribute.db_value]
+    BoardDB.objects.filter(id__in=mandatory).update(db_mandatory=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('typeclasses', '0001_initial'),
+        ('boards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_mandatory, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,12 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from athanor.utils.time import utcnow
+from athanor.utils.text import clean_and_ansi
 from evennia.typeclasses.models import TypedObject, SharedMemoryModel
 from athanor.access.models import AbstractACLEntry
+from athanor_bbs.boards.registry import BOARDS
+from athanor_bbs.boards.revisions import record_revision
+from athanor_bbs.boards.search import TOPIC_NAMES
 
 
 class BoardDB(TypedObject):
@@ -19,6 +23,10 @@ class BoardDB(TypedObject):
     db_ikey = models.CharField(max_length=255)
     db_ckey = models.CharField(max_length=255)
     db_next_post_number = models.PositiveIntegerField(default=0, null=False)
+    db_mandatory = models.BooleanField(default=False, null=False)
+    db_anonymous = models.BooleanField(default=False, null=False)
+    db_retention = models.PositiveIntegerField(default=0, null=False)
+    db_page_size = models.PositiveIntegerField(default=0, null=False)
     ignoring = models.ManyToManyField('identities.IdentityDB', related_name='ignored_boards')
 
     class Meta:
@@ -35,6 +43,27 @@ class BoardACL(AbstractACLEntry):
     class Meta:
         unique_together = (('resource', 'identity', 'mode'),)
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.forget_prefetched(self.resource_id)
+
+    def delete(self, *args, **kwargs):
+        resource_id = self.resource_id
+        result = super().delete(*args, **kwargs)
+        self.forget_prefetched(resource_id)
+        return result
+
+    @staticmethod
+    def forget_prefetched(board_id):
+        """
+        The board controller's warm-up prefetches acl_entries onto boards which then stay cached for the
+        life of the process. Drop that prefetch so the board's next ACL read sees the change. Code that
+        changes ACL rows through a QuerySet must call this itself.
+        """
+        for board in {BOARDS.get(board_id), BoardDB.get_cached_instance(board_id)}:
+            if board is not None:
+                getattr(board, '_prefetched_objects_cache', dict()).pop('acl_entries', None)
+
 
 class BoardTopic(SharedMemoryModel):
     db_board = models.ForeignKey('boards.BoardDB', related_name='topics', on_delete=models.CASCADE)
@@ -50,6 +79,20 @@ class BoardTopic(SharedMemoryModel):
         verbose_name = 'Topics'
         verbose_name_plural = 'Topics'
         unique_together = (('db_board', 'db_order'), )
+        indexes = [
+            models.Index(fields=['db_board', '-db_date_latest', '-id'], name='boards_topic_board_latest'),
+            models.Index(fields=['-db_date_latest', '-id'], name='boards_topic_latest'),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        TOPIC_NAMES.add(self.pk, self.db_name)
+
+    def delete(self, *args, **kwargs):
+        topic_id = self.pk
+        result = super().delete(*args, **kwargs)
+        TOPIC_NAMES.remove(topic_id)
+        return result
 
     @classmethod
     def validate_key(cls, key_text, rename_from=None):
@@ -59,6 +102,25 @@ class BoardTopic(SharedMemoryModel):
     def validate_order(cls, order_text, rename_from=None):
         return int(order_text)
 
+    @classmethod
+    def recent(cls, board=None, hidden=(), before=None):
+        """
+        Topics by latest activity, newest first: those on <board>, or else those on every board except
+        the ids in <hidden>. <before> is a (db_date_latest, id) keyset position to continue after.
+
+        Across boards, hidden boards are excluded rather than visible ones included: an IN filter makes
+        the database gather and sort every visible topic, where NOT IN lets it walk boards_topic_latest.
+        """
+        if board:
+            topics = cls.objects.filter(db_board=board)
+        else:
+            topics = cls.objects.exclude(db_board__in=hidden) if hidden else cls.objects.all()
+        if before:
+            latest, pk = before
+            topics = topics.filter(models.Q(db_date_latest__lt=latest) |
+                                   models.Q(db_date_latest=latest, id__lt=pk))
+        return topics.order_by('-db_date_latest', '-id')
+
     def __str__(self):
         return self.db_name
 
@@ -70,13 +132,16 @@ class BoardTopic(SharedMemoryModel):
             return True
         return self.board.check_permission(checker=checker, type="admin")
 
-    def edit_post(self, find=None, replace=None):
-        if not find:
-            raise ValueError("No text entered to find.")
-        if not replace:
-            replace = ''
-        self.date_modified = utcnow()
-        self.text = self.text.replace(find, replace)
+    def opening_post(self):
+        return self.posts.order_by('db_order').first()
+
+    def edit_post(self, editor=None, find=None, replace=None):
+        if not (post := self.opening_post()):
+            raise ValueError("Post not found!")
+        with transaction.atomic():
+            post.edit_post(editor, find=find, replace=replace)
+            self.db_date_modified = post.db_date_modified
+            self.save(update_fields=['db_date_modified'])
 
     def update_read(self, account):
         acc_read, created = self.read.get_or_create(account=account)
@@ -84,17 +149,17 @@ class BoardTopic(SharedMemoryModel):
         acc_read.save()
 
     def fullname(self, mode=""):
-        return f"{mode} Board Post: ({self.db_board.alias.db_abbr_global}/{self.db_order}): {self.db_cname}"
+        return f"{mode} Board Post: ({self.post_alias()}): {self.db_cname}"
 
     def generate_substitutions(self, viewer):
         return {'name': self.db_name,
                 'cname': self.db_cname,
                 'typename': 'BBS Post',
-                'fullname': self.fullname}
+                'fullname': self.fullname()}
 
 
 class BoardPost(SharedMemoryModel):
-    db_topic = models.ForeignKey('boards.BoardTopic', related_name='topics', on_delete=models.CASCADE)
+    db_topic = models.ForeignKey('boards.BoardTopic', related_name='posts', on_delete=models.CASCADE)
     db_author = models.ForeignKey('identities.IdentityDB', null=True, related_name='bbs_posts',
                                   on_delete=models.PROTECT)
     db_name = models.CharField(max_length=255, blank=False, null=False)
@@ -109,6 +174,40 @@ class BoardPost(SharedMemoryModel):
         verbose_name = 'Post'
         verbose_name_plural = 'Posts'
         unique_together = (('db_topic', 'db_order'),)
+        indexes = [
+            models.Index(fields=['db_topic', 'db_date_created'], name='boards_post_topic_created'),
+        ]
+
+    def edit_post(self, editor=None, find=None, replace=None):
+        if not find:
+            raise ValueError("No text entered to find.")
+        if not replace:
+            replace = ''
+        with transaction.atomic():
+            # Lock the row so concurrent edits queue up instead of numbering the same revision, and read
+            # the text through values_list(), since the idmapper would hand back this cached instance.
+            self.db_cbody = BoardPost.objects.select_for_update().values_list('db_cbody', flat=True)\
+                .get(id=self.id)
+            if find not in self.db_cbody:
+                raise ValueError("Text to find was not found in the post.")
+            clean_body, body = clean_and_ansi(self.db_cbody.replace(find, replace), thing_name='BBS Post')
+            date = utcnow()
+            record_revision(self, body, editor=editor, date=date)
+            self.db_body, self.db_cbody, self.db_date_modified = clean_body, body, date
+            self.save(update_fields=['db_body', 'db_cbody', 'db_date_modified'])
+
+
+class PostRevision(models.Model):
+    post = models.ForeignKey(BoardPost, related_name='revisions', on_delete=models.CASCADE)
+    number = models.PositiveIntegerField(null=False)
+    editor = models.ForeignKey('identities.IdentityDB', null=True, related_name='bbs_revisions',
+                               on_delete=models.SET_NULL)
+    date_created = models.DateTimeField(null=False)
+    snapshot = models.BooleanField(default=False, null=False)
+    data = models.BinaryField(null=False)
+
+    class Meta:
+        unique_together = (('post', 'number'),)
 
 
 class TopicRead(models.Model):
@@ -118,3 +217,8 @@ class TopicRead(models.Model):
 
     class Meta:
         unique_together = (('identity', 'topic'),)
+
+
+class BoardDigest(models.Model):
+    identity = models.OneToOneField('identities.IdentityDB', related_name='bbs_digest', on_delete=models.CASCADE)
+    date_last_sent = models.DateTimeField(null=False)
@@ -0,0 +1,28 @@
+from math import ceil
+
+from evennia.utils.evmore import EvMore
+
+
+class PostPager(EvMore):
+    """
+    EvMore pager over a queryset of posts. Each page slices the queryset, so only the posts
+    on the page being shown are fetched, and renders them through <render>, which takes
+    the page's posts and yields one text chunk per post.
+    """
+
+    def __init__(self, caller, posts, render, per_page=3, **kwargs):
+        self.render = render
+        self.per_page = per_page
+        super().__init__(caller, posts, **kwargs)
+
+    def init_pages(self, posts):
+        self._data = posts
+        self._npages = max(1, ceil(posts.count() / self.per_page))
+        self._paginator = self.paginate
+
+    def paginate(self, pageno):
+        start = pageno * self.per_page
+        return self._data[start:start + self.per_page]
+
+    def page_formatter(self, page):
+        return '\n'.join(str(chunk) for chunk in self.render(page))
@@ -0,0 +1,58 @@
+from athanor_bbs.boards.utils import DeferredLoad
+
+
+class BoardRegistry(DeferredLoad):
+    """
+    Process-wide cache of every board, by id and by alias (its prefix_order).
+
+    Filled by the board controller's warm-up; until then `loaded` is False and callers should query the
+    database instead. Board save() and delete() keep it coherent through saved() and deleted().
+    """
+
+    def __init__(self):
+        self.boards = dict()
+        self.aliases = dict()
+        self.alias_of = dict()
+        self.loaded = False
+
+    def replace(self, boards):
+        self.boards = {board.pk: board for board in boards}
+        self.aliases = dict()
+        self.alias_of = dict()
+        for board in boards:
+            self._alias(board)
+        self.loaded = True
+
+    def _alias(self, board):
+        alias = board.prefix_order.upper()
+        if (old := self.alias_of.get(board.pk, None)) == alias:
+            return
+        if old is not None and self.aliases.get(old, None) is board:
+            del self.aliases[old]
+        self.aliases[alias] = board
+        self.alias_of[board.pk] = alias
+
+    def saved(self, board):
+        if self.defer(self.saved, board) or not self.loaded:
+            return
+        self.boards[board.pk] = board
+        self._alias(board)
+
+    def deleted(self, board_id):
+        if self.defer(self.deleted, board_id) or not self.loaded:
+            return
+        board = self.boards.pop(board_id, None)
+        if (alias := self.alias_of.pop(board_id, None)) is not None and self.aliases.get(alias, None) is board:
+            del self.aliases[alias]
+
+    def all(self):
+        return list(self.boards.values())
+
+    def get(self, board_id):
+        return self.boards.get(board_id, None)
+
+    def by_alias(self, alias):
+        return self.aliases.get(alias.upper(), None)
+
+
+BOARDS = BoardRegistry()
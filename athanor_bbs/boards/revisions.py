@@ -0,0 +1,71 @@
+import json
+import zlib
+from difflib import SequenceMatcher
+
+from django.conf import settings
+from django.db.models import Max
+
+from athanor.utils.time import utcnow
+
+
+def pack(data):
+    return zlib.compress(json.dumps(data).encode('utf-8'))
+
+
+def unpack(data):
+    return json.loads(zlib.decompress(bytes(data)).decode('utf-8'))
+
+
+def make_delta(old, new):
+    """
+    Describes <new> as a list of line ranges [start, end] copied from <old> and strings of new text.
+    """
+    old_lines, new_lines = old.splitlines(keepends=True), new.splitlines(keepends=True)
+    delta = list()
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_lines, new_lines, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            delta.append([i1, i2])
+        elif j2 > j1:
+            delta.append(''.join(new_lines[j1:j2]))
+    return delta
+
+
+def apply_delta(old, delta):
+    old_lines = old.splitlines(keepends=True)
+    return ''.join(''.join(old_lines[op[0]:op[1]]) if isinstance(op, list) else op for op in delta)
+
+
+def record_revision(post, new_text, editor=None, date=None):
+    """
+    Stores <new_text> as the next revision of <post>, before it replaces the post's current text.
+
+    The first edit also stores the original text as revision 0. Every BBS_REVISION_SNAPSHOT_INTERVAL
+    revisions is stored in full; the rest are deltas against the revision before them.
+    """
+    if not date:
+        date = utcnow()
+    latest = post.revisions.aggregate(latest=Max('number'))['latest']
+    if latest is None:
+        post.revisions.create(number=0, editor=post.db_author, date_created=post.db_date_created,
+                              snapshot=True, data=pack(post.db_cbody))
+        latest = 0
+    number = latest + 1
+    snapshot = not number % settings.BBS_REVISION_SNAPSHOT_INTERVAL
+    data = pack(new_text if snapshot else make_delta(post.db_cbody, new_text))
+    return post.revisions.create(number=number, editor=editor, date_created=date, snapshot=snapshot, data=data)
+
+
+def reconstruct(post, number):
+    """
+    Rebuilds the text of revision <number> from the nearest snapshot at or before it.
+    """
+    base = post.revisions.filter(number__lte=number, snapshot=True).aggregate(base=Max('number'))['base']
+    if base is None:
+        raise ValueError(f"Revision {number} not found!")
+    revisions = list(post.revisions.filter(number__gte=base, number__lte=number).order_by('number'))
+    if revisions[-1].number != number:
+        raise ValueError(f"Revision {number} not found!")
+    text = unpack(revisions[0].data)
+    for revision in revisions[1:]:
+        text = apply_delta(text, unpack(revision.data))
+    return text
@@ -0,0 +1,84 @@
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+_local = threading.local()
+_pinned = dict()
+
+
+def pin_primary(key):
+    """
+    Keeps reads for <key> (an account id) on the primary database for BBS_REPLICA_PIN_SECONDS,
+    so that someone who just wrote to the BBS sees their own changes even if the replica lags.
+    """
+    _pinned[key] = time.monotonic() + settings.BBS_REPLICA_PIN_SECONDS
+
+
+def is_pinned(key):
+    if (until := _pinned.get(key, None)) is None:
+        return False
+    if until > time.monotonic():
+        return True
+    _pinned.pop(key, None)
+    return False
+
+
+@contextmanager
+def use_replica(key=None):
+    """
+    Routes reads of boards models made in this thread, inside the block, to BBS_READ_DATABASE.
+    """
+    previous = getattr(_local, 'replica', False)
+    _local.replica = bool(settings.BBS_READ_DATABASE) and not is_pinned(key)
+    try:
+        yield
+    finally:
+        _local.replica = previous
+
+
+def read_only(func):
+    """
+    Decorator for controller methods taking a session first which only read from the BBS.
+    """
+    @wraps(func)
+    def wrapper(controller, session, *args, **kwargs):
+        with use_replica(session.uid):
+            return func(controller, session, *args, **kwargs)
+    return wrapper
+
+
+class BoardRouter:
+    """
+    Sends boards reads to the replica inside use_replica() blocks, and to the primary everywhere else.
+    All writes go to the primary.
+
+    Reads outside a block must be routed explicitly: left to Django, a read related to an instance
+    that was loaded from the replica (and kept alive by the idmapper) would follow it there.
+    """
+    app_label = 'boards'
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != self.app_label:
+            return None
+        if getattr(_local, 'replica', False):
+            return settings.BBS_READ_DATABASE
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label != self.app_label:
+            return None
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if settings.BBS_READ_DATABASE and self.app_label in (obj1._meta.app_label, obj2._meta.app_label):
+            return {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, settings.BBS_READ_DATABASE}
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if app_label == self.app_label and settings.BBS_READ_DATABASE and db == settings.BBS_READ_DATABASE:
+            return False
+        return None
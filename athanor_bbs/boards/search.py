@@ -0,0 +1,89 @@
+from collections import defaultdict, Counter
+
+from athanor_bbs.boards.utils import DeferredLoad
+
+
+def trigrams(text):
+    text = f"  {text.lower()} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex(DeferredLoad):
+    """
+    In-memory fuzzy name index. Maps each trigram to the keys whose names contain it, and ranks
+    matches by the Jaccard similarity of their trigram sets to the query's.
+
+    To warm up off the reactor, build() a new index in a thread and install() it into the live one.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(set)
+        self.entries = dict()
+        self.loaded = False
+
+    def load(self, items):
+        self.postings.clear()
+        self.entries.clear()
+        for key, text in items:
+            self.add(key, text)
+        self.loaded = True
+
+    @classmethod
+    def build(cls, items):
+        index = cls()
+        index.load(items)
+        return index
+
+    def replace(self, index):
+        self.postings = index.postings
+        self.entries = index.entries
+        self.loaded = True
+
+    def add(self, key, text):
+        if self.defer(self.add, key, text):
+            return
+        if (entry := self.entries.get(key, None)) is not None:
+            if entry[0] == text:
+                return
+            self.remove(key)
+        grams = trigrams(text)
+        self.entries[key] = (text, grams)
+        for gram in grams:
+            self.postings[gram].add(key)
+
+    def remove(self, key):
+        if self.defer(self.remove, key):
+            return
+        if (entry := self.entries.pop(key, None)) is None:
+            return
+        for gram in entry[1]:
+            if (keys := self.postings.get(gram, None)) is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[gram]
+
+    def matches(self, query, threshold=0.3):
+        """
+        Returns (score, key) pairs for the names at least <threshold> similar to <query>, best match first.
+        """
+        grams = trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        scored = list()
+        for key, count in shared.items():
+            score = count / (len(grams) + len(self.entries[key][1]) - count)
+            if score >= threshold:
+                scored.append((score, key))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return scored
+
+    def search(self, query, threshold=0.3):
+        """
+        Returns the keys whose names are at least <threshold> similar to <query>, best match first.
+        """
+        return [key for score, key in self.matches(query, threshold)]
+
+
+BOARD_NAMES = TrigramIndex()
+TOPIC_NAMES = TrigramIndex()
@@ -0,0 +1,37 @@
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+
+class BBSStats:
+    """
+    Process-wide counters and timers for the BBS, shown by @fboard/stats.
+    """
+
+    def __init__(self):
+        self.counters = Counter()
+        self.timings = defaultdict(lambda: [0, 0.0])
+
+    def incr(self, name, amount=1):
+        self.counters[name] += amount
+
+    @contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timing = self.timings[name]
+            timing[0] += 1
+            timing[1] += time.perf_counter() - started
+
+    def hit_rate(self, name):
+        hits, misses = self.counters[f"{name}_hits"], self.counters[f"{name}_misses"]
+        return hits, (hits / (hits + misses) if hits + misses else 0.0)
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+
+
+STATS = BBSStats()
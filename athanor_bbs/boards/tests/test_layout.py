@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase
+from evennia.utils.test_resources import EvenniaTest
+
+from athanor_bbs.boards.layout import DateFormatCache
+from athanor_bbs.boards.stats import STATS
+
+
+class ZoneStyler:
+
+    def __init__(self, tz):
+        self.timezone = tz
+
+    def localize_timestring(self, date, time_format='%b %d %Y'):
+        return date.astimezone(self.timezone).strftime(time_format)
+
+
+class TestDateFormatCache(SimpleTestCase):
+
+    def setUp(self):
+        STATS.reset()
+        self.dates = DateFormatCache()
+
+    def test_matches_localize_timestring_across_dst(self):
+        for zone in ('America/New_York', 'Australia/Lord_Howe', 'Asia/Kolkata', 'Pacific/Chatham'):
+            styling = ZoneStyler(ZoneInfo(zone))
+            date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+            while date.year == 2024:
+                with self.subTest(zone=zone, date=date):
+                    self.assertEqual(self.dates.format(styling, date), styling.localize_timestring(date))
+                date += timedelta(minutes=37)
+
+    def test_cached_path_is_taken(self):
+        styling = ZoneStyler(ZoneInfo('Europe/London'))
+        with mock.patch.object(styling, 'localize_timestring') as localize:
+            for hour in range(24):
+                self.dates.format(styling, datetime(2024, 6, 1, hour, tzinfo=timezone.utc))
+        localize.assert_not_called()
+        self.assertEqual(STATS.hit_rate('date_format')[0], 22)
+
+    def test_styler_without_timezone_is_counted(self):
+        styling = mock.Mock(spec=['localize_timestring'])
+        styling.localize_timestring.return_value = 'Jun 01 2024'
+        self.assertEqual(self.dates.format(styling, datetime(2024, 6, 1, tzinfo=timezone.utc)), 'Jun 01 2024')
+        self.assertEqual(STATS.counters['date_format_uncached'], 1)
+
+
+class TestRealStylerIsCached(EvenniaTest):
+    """
+    DATES only caches stylers which expose their timezone. Fails if the game's styler does not.
+    """
+
+    def test_character_styler_is_cached(self):
+        styling = self.char1.styler
+        dates = DateFormatCache()
+        self.assertIsNotNone(dates.zone(styling), f"{type(styling).__name__} exposes no timezone to cache by.")
+        date = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+        expected = styling.localize_timestring(date, time_format='%b %d %Y')
+        STATS.reset()
+        self.assertEqual(dates.format(styling, date), expected)
+        self.assertEqual(dates.format(styling, date + timedelta(minutes=1)), expected)
+        self.assertEqual(STATS.hit_rate('date_format')[0], 1)
@@ -0,0 +1,66 @@
+import re
+from datetime import datetime, timezone
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase
+
+from athanor_bbs.boards.models import BoardTopic, BoardPost, TopicRead
+
+# A full table scan, as opposed to 'SCAN <table> USING [COVERING] INDEX <index>' or 'SEARCH ...'.
+_FULL_SCAN = re.compile(r"^SCAN (TABLE )?(?P<table>\w+)$")
+
+CURSOR = (datetime(2024, 1, 1, tzinfo=timezone.utc), 50)
+
+
+@skipUnless(connection.vendor == 'sqlite', "Query plan tests read SQLite's EXPLAIN QUERY PLAN.")
+class TestQueryPlans(TestCase):
+    """
+    Checks that the BBS's hot queries are answered by the index meant for them, without scanning a
+    table or sorting in a temporary B-tree.
+    """
+
+    def plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertPlan(self, queryset, expected):
+        """
+        Fails unless some step of the plan contains <expected>, and no step scans a table or sorts.
+        """
+        plan = self.plan(queryset)
+        shown = '\n'.join(plan)
+        for detail in plan:
+            if (found := _FULL_SCAN.match(detail)):
+                self.fail(f"{found.group('table')} is scanned without an index:\n{shown}")
+            if 'TEMP B-TREE' in detail:
+                self.fail(f"Results are sorted instead of read in index order:\n{shown}")
+        self.assertIn(expected, shown)
+
+    def test_board_topics_by_latest(self):
+        self.assertPlan(BoardTopic.recent(1)[:21], 'USING INDEX boards_topic_board_latest')
+        self.assertPlan(BoardTopic.recent(1, before=CURSOR)[:21], 'USING INDEX boards_topic_board_latest')
+
+    def test_recent_topics_across_boards(self):
+        self.assertPlan(BoardTopic.recent().select_related('db_board')[:21], 'USING INDEX boards_topic_latest')
+        self.assertPlan(BoardTopic.recent(hidden=[2, 3], before=CURSOR).select_related('db_board')[:21],
+                        'USING INDEX boards_topic_latest')
+
+    def test_topics_by_order(self):
+        self.assertPlan(BoardTopic.objects.filter(db_board_id=1, db_order__in=[1, 2, 3]).order_by('db_order'),
+                        '(db_board_id=? AND db_order=?)')
+
+    def test_unread_topics(self):
+        self.assertPlan(BoardTopic.objects.filter(db_board_id=1)
+                        .exclude(readers__identity_id=1, readers__date_read__gte=F('db_date_modified')),
+                        '(identity_id=? AND topic_id=?)')
+
+    def test_posts_by_created(self):
+        self.assertPlan(BoardPost.objects.filter(db_topic_id=1).order_by('db_date_created'),
+                        'USING INDEX boards_post_topic_created')
+
+    def test_topic_read(self):
+        self.assertPlan(TopicRead.objects.filter(identity_id=1, topic_id=1), '(identity_id=? AND topic_id=?)')
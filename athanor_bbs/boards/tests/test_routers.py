@@ -0,0 +1,73 @@
+from unittest import skipUnless
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.test import TestCase, override_settings
+
+from athanor_bbs.boards.routers import BoardRouter, use_replica, pin_primary, _pinned
+
+REPLICA = 'bbs_test_replica'
+
+# A second SQLite database stands in for the replica. It has to be configured before the test runner
+# sets databases up, which happens after this module is imported.
+if connections.settings[DEFAULT_DB_ALIAS]['ENGINE'] == 'django.db.backends.sqlite3' \
+        and REPLICA not in connections.settings:
+    connections.settings[REPLICA] = dict(connections.settings[DEFAULT_DB_ALIAS], NAME=f'{REPLICA}.sqlite3',
+                                         TEST=dict(connections.settings[DEFAULT_DB_ALIAS]['TEST'], NAME=None))
+
+
+class ReplicaTestRouter(BoardRouter):
+    """
+    Routes contenttypes as if it were the boards app, so only Django's own tables are needed.
+    """
+    app_label = 'contenttypes'
+
+
+@skipUnless(REPLICA in connections.settings, "Router tests need SQLite.")
+@override_settings(DATABASE_ROUTERS=[ReplicaTestRouter()], BBS_READ_DATABASE=REPLICA, BBS_REPLICA_PIN_SECONDS=10)
+class TestBoardRouter(TestCase):
+    databases = {DEFAULT_DB_ALIAS, REPLICA}
+
+    def setUp(self):
+        _pinned.clear()
+        ContentType.objects.using(REPLICA).create(app_label='bbs_test', model='replica_only')
+
+    def tearDown(self):
+        _pinned.clear()
+
+    def replica_only(self):
+        return ContentType.objects.filter(app_label='bbs_test', model='replica_only').first()
+
+    def test_reads_use_primary_outside_blocks(self):
+        self.assertIsNone(self.replica_only())
+
+    def test_reads_use_replica_inside_blocks(self):
+        with use_replica():
+            found = self.replica_only()
+        self.assertIsNotNone(found)
+        self.assertEqual(found._state.db, REPLICA)
+
+    def test_pinned_reads_use_primary(self):
+        pin_primary(1)
+        with use_replica(1):
+            self.assertIsNone(self.replica_only())
+        with use_replica(2):
+            self.assertIsNotNone(self.replica_only())
+
+    def test_replica_instances_do_not_pull_reads_to_replica(self):
+        with use_replica():
+            found = self.replica_only()
+        self.assertEqual(router.db_for_read(ContentType, instance=found), DEFAULT_DB_ALIAS)
+        self.assertFalse(ContentType.objects.filter(pk=found.pk, app_label='bbs_test').exists())
+
+    def test_writes_use_primary(self):
+        with use_replica():
+            ContentType.objects.create(app_label='bbs_test', model='written')
+            self.assertEqual(router.db_for_write(ContentType), DEFAULT_DB_ALIAS)
+        self.assertTrue(ContentType.objects.using(DEFAULT_DB_ALIAS).filter(model='written').exists())
+        self.assertFalse(ContentType.objects.using(REPLICA).filter(model='written').exists())
+
+    def test_other_apps_are_not_routed(self):
+        with use_replica():
+            self.assertIsNone(BoardRouter().db_for_read(ContentType))
+            self.assertIsNone(BoardRouter().db_for_write(ContentType))
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase
+
+from athanor_bbs.boards.utils import make_cursor, parse_cursor
+
+
+class TestCursors(SimpleTestCase):
+
+    def test_round_trip(self):
+        date = datetime(2024, 3, 10, 7, 30, 15, 123456, tzinfo=timezone.utc)
+        self.assertEqual(parse_cursor(make_cursor(date, 42)), (date, 42))
+
+    def test_invalid_cursors(self):
+        for cursor in ('', 'abc', '12-x', '1000000000000000000000000-1', f"{'9' * 400}-1"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaisesRegex(ValueError, 'Invalid page cursor'):
+                    parse_cursor(cursor)
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from evennia.utils.test_resources import EvenniaTest
+
+from athanor_bbs.boards import views
+from athanor_bbs.boards.boards import DefaultBoard
+from athanor_bbs.boards.models import BoardTopic, BoardPost
+
+IdentityDB = apps.get_model('identities', 'IdentityDB')
+
+
+def fake_board(pk=1, key='Announcements', **kwargs):
+    fields = dict(pk=pk, key=key, db_key=key, db_ckey=key, prefix_order=f'A{pk}', db_order=pk,
+                  db_next_post_number=1, db_mandatory=False, db_anonymous=False, db_retention=0,
+                  db_page_size=0, db_lock_storage='read:all();post:all();admin:perm(Admin)')
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+@override_settings(ROOT_URLCONF='athanor_bbs.boards.urls')
+class TestBoardListView(TestCase):
+    """
+    Runs the board list through the test client with stand-in boards, so that only the ETag and
+    conditional-response handling are under test.
+    """
+
+    def setUp(self):
+        self.boards = [fake_board(1, 'Announcements'), fake_board(2, 'Public', db_mandatory=True)]
+        patcher = mock.patch.object(views, '_visible_boards', side_effect=lambda request: self.boards)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lists_boards_with_etag(self):
+        response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.has_header('ETag'))
+        self.assertEqual([board['name'] for board in response.json()['boards']], ['Announcements', 'Public'])
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get('/')['ETag']
+        response = self.client.get('/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_etag_changes_with_board_state(self):
+        changes = {'db_key': 'News', 'db_mandatory': True, 'db_page_size': 5,
+                   'db_lock_storage': 'read:perm(Admin)', 'db_next_post_number': 2}
+        for field, value in changes.items():
+            with self.subTest(field=field):
+                etag = self.client.get('/')['ETag']
+                setattr(self.boards[0], field, value)
+                response = self.client.get('/', HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_changes_with_visible_boards(self):
+        etag = self.client.get('/')['ETag']
+        self.boards.pop()
+        self.assertNotEqual(self.client.get('/')['ETag'], etag)
+
+
+@override_settings(ROOT_URLCONF='athanor_bbs.boards.urls')
+class TestBoardViews(EvenniaTest):
+    """
+    Runs the views against real boards, topics and posts. Read access is decided by check_acl(), which
+    here hides the board named 'Staff'.
+    """
+
+    def setUp(self):
+        super().setUp()
+        identity = IdentityDB.objects.create(db_key='BBS Test')
+        self.public = DefaultBoard.objects.create(db_key='Public', db_ckey='Public', db_ikey='public', db_order=1,
+                                                  db_identity=identity, db_page_size=2)
+        self.staff = DefaultBoard.objects.create(db_key='Staff', db_ckey='Staff', db_ikey='staff', db_order=2,
+                                                 db_identity=identity)
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for board in (self.public, self.staff):
+            for order in range(1, 6):
+                date = start + timedelta(hours=order)
+                topic = BoardTopic.objects.create(db_board=board, db_name=f"Topic {order}", db_cname=f"Topic {order}",
+                                                  db_date_created=date, db_date_modified=date, db_date_latest=date,
+                                                  db_order=order)
+                BoardPost.objects.create(db_topic=topic, db_name=topic.db_name, db_cname=topic.db_cname,
+                                         db_date_created=date, db_date_modified=date, db_order=1,
+                                         db_body=f"Body {order}", db_cbody=f"Body {order}")
+        patcher = mock.patch.object(DefaultBoard, 'check_acl', create=True,
+                                    new=lambda board, user, mode: board.db_key != 'Staff')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client.force_login(self.account)
+
+    def test_board_list_hides_unreadable_boards(self):
+        response = self.client.get('/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([board['id'] for board in response.json()['boards']], [self.public.pk])
+
+    def test_hidden_board_not_found(self):
+        self.assertEqual(self.client.get(f'/{self.staff.pk}/').status_code, 404)
+        self.assertEqual(self.client.get(f'/{self.staff.pk}/1/').status_code, 404)
+
+    def test_anonymous_sees_nothing(self):
+        self.client.logout()
+        self.assertEqual(self.client.get('/').json(), {'boards': []})
+        self.assertEqual(self.client.get(f'/{self.public.pk}/').status_code, 404)
+
+    def test_topic_page_paginates(self):
+        pages = list()
+        url = f'/{self.public.pk}/'
+        while url:
+            data = self.client.get(url).json()
+            pages.append([topic['order'] for topic in data['topics']])
+            url = f'/{self.public.pk}/?before={data["next"]}' if data['next'] else None
+        self.assertEqual(pages, [[5, 4], [3, 2], [1]])
+
+    def test_topic_page_rejects_bad_cursor(self):
+        response = self.client.get(f'/{self.public.pk}/?before=1000000000000000000000000-1')
+        self.assertEqual(response.status_code, 400)
+
+    def test_topic_page_etag_follows_page_size(self):
+        etag = self.client.get(f'/{self.public.pk}/')['ETag']
+        self.assertEqual(self.client.get(f'/{self.public.pk}/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.public.db_page_size = 3
+        self.public.save(update_fields=['db_page_size'])
+        response = self.client.get(f'/{self.public.pk}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['topics']), 3)
+
+    def test_topic_posts(self):
+        response = self.client.get(f'/{self.public.pk}/3/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([post['body'] for post in response.json()['posts']], ['Body 3'])
+
+    def test_not_modified_loads_no_posts(self):
+        for url in (f'/{self.public.pk}/', f'/{self.public.pk}/3/'):
+            with self.subTest(url=url):
+                etag = self.client.get(url)['ETag']
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertFalse([query['sql'] for query in queries if 'boards_boardpost' in query['sql']])
+
+    def test_rejects_writes(self):
+        self.assertEqual(self.client.post('/').status_code, 405)
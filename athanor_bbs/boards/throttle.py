@@ -0,0 +1,67 @@
+class TokenBucket:
+    """
+    Holds up to <capacity> tokens and regains <rate> tokens per second. Times are wall-clock
+    seconds so that saved buckets remain meaningful after a reload.
+    """
+    __slots__ = ('capacity', 'rate', 'tokens', 'stamp')
+
+    def __init__(self, capacity, rate, tokens=None, stamp=0.0):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity if tokens is None else tokens
+        self.stamp = stamp
+
+    def refill(self, now):
+        if now > self.stamp:
+            self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+
+    def wait(self, now, amount=1):
+        """
+        Returns how many seconds until <amount> tokens are available, or 0 if they are now.
+        """
+        self.refill(now)
+        if self.tokens >= amount:
+            return 0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, now, amount=1):
+        self.refill(now)
+        self.tokens -= amount
+
+
+class FloodControl:
+    """
+    A TokenBucket per key (identity or board id), created on demand.
+    """
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.buckets = dict()
+
+    def bucket(self, key):
+        if (found := self.buckets.get(key, None)) is None:
+            found = self.buckets[key] = TokenBucket(self.capacity, self.rate)
+        return found
+
+    def wait(self, key, now):
+        return self.bucket(key).wait(now)
+
+    def consume(self, key, now):
+        self.bucket(key).consume(now)
+
+    def export(self, now):
+        """
+        Returns the buckets which are not full, as {key: (tokens, stamp)}. Full buckets are the default.
+        """
+        data = dict()
+        for key, bucket in self.buckets.items():
+            bucket.refill(now)
+            if bucket.tokens < bucket.capacity:
+                data[key] = (bucket.tokens, bucket.stamp)
+        return data
+
+    def restore(self, data):
+        for key, (tokens, stamp) in data.items():
+            self.buckets[key] = TokenBucket(self.capacity, self.rate, tokens, stamp)
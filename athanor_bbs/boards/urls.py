@@ -0,0 +1,12 @@
+from django.urls import path
+
+from athanor_bbs.boards import views
+
+app_name = 'boards'
+
+# Include from the game's web/urls.py, e.g. path('api/bbs/', include('athanor_bbs.boards.urls')).
+urlpatterns = [
+    path('', views.board_list, name='board_list'),
+    path('<int:board_id>/', views.topic_page, name='topic_page'),
+    path('<int:board_id>/<int:topic_order>/', views.topic_posts, name='topic_posts'),
+]
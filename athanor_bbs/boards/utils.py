@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+
+
+def make_cursor(date, pk):
+    """
+    Encodes a keyset pagination position as '<epoch microseconds>-<id>'.
+    """
+    micros = int(date.timestamp()) * 1000000 + date.microsecond
+    return f"{micros}-{pk}"
+
+
+def parse_cursor(cursor):
+    """
+    Reverses make_cursor(), returning (date, pk).
+    """
+    try:
+        micros, pk = (int(part) for part in cursor.strip().split('-', 1))
+        seconds, micro = divmod(micros, 1000000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=micro), pk
+    except (ValueError, OverflowError, OSError):
+        # Out-of-range timestamps raise OverflowError or OSError, depending on the platform and size.
+        raise ValueError(f"Invalid page cursor: {cursor}")
+
+
+class DeferredLoad:
+    """
+    Mixin for in-memory indexes which are fetched from the database in a worker thread.
+
+    Subclasses implement replace(data) to adopt freshly fetched data, and pass each change through
+    defer() first. Between begin_load() and install(), changes are queued rather than applied, then
+    replayed over the new data, so nothing done while the thread was reading is lost. Both must be
+    called from the reactor thread, as must every change.
+    """
+    pending = None
+
+    def begin_load(self):
+        self.pending = list()
+
+    def defer(self, method, *args):
+        if self.pending is None:
+            return False
+        self.pending.append((method, args))
+        return True
+
+    def install(self, data):
+        pending, self.pending = self.pending or list(), None
+        self.replace(data)
+        for method, args in pending:
+            method(*args)
+
+    def abort_load(self):
+        """
+        Gives up on a failed load, applying the queued changes to whatever the index already holds.
+        """
+        pending, self.pending = self.pending or list(), None
+        for method, args in pending:
+            method(*args)
+
+    def replace(self, data):
+        raise NotImplementedError()
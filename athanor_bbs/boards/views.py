@@ -0,0 +1,131 @@
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.http import JsonResponse
+from django.views.decorators.http import condition, require_GET
+
+from athanor_bbs.boards.boards import DefaultBoard
+from athanor_bbs.boards.models import BoardTopic, BoardACL
+from athanor_bbs.boards.utils import make_cursor, parse_cursor
+
+
+def _etag(*parts):
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def _visible_boards(request):
+    if not request.user.is_authenticated:
+        return list()
+    return [board for board in DefaultBoard.objects.all_family() if board.check_acl(request.user, 'read')]
+
+
+def _visible_board(request, board_id):
+    if not request.user.is_authenticated:
+        return None
+    board = DefaultBoard.objects.filter_family(id=board_id).first()
+    if not board or not board.check_acl(request.user, 'read'):
+        return None
+    return board
+
+
+def _not_found(what):
+    return JsonResponse({'error': f"{what} not found."}, status=404)
+
+
+def board_list_etag(request):
+    """
+    Covers everything board_list shows or filters on: each visible board's names, alias, settings and
+    locks, plus the ACL entries of those boards.
+    """
+    boards = _visible_boards(request)
+    acl = list(BoardACL.objects.filter(resource_id__in=[board.pk for board in boards]).order_by('id').values())
+    return _etag(request.user.pk, [(board.pk, board.db_key, board.db_ckey, board.prefix_order,
+                                    board.db_next_post_number, board.db_mandatory, board.db_anonymous,
+                                    board.db_retention, board.db_page_size, board.db_lock_storage)
+                                   for board in boards], acl)
+
+
+def topic_page_etag(request, board_id):
+    if not (board := _visible_board(request, board_id)):
+        return None
+    latest = board.topics.aggregate(count=Count('id'), modified=Max('db_date_modified'),
+                                    latest=Max('db_date_latest'))
+    return _etag(request.user.pk, board.pk, board.db_next_post_number, latest['count'], latest['modified'],
+                 latest['latest'], request.GET.get('before', ''))
+
+
+def topic_posts_etag(request, board_id, topic_order):
+    if not (board := _visible_board(request, board_id)):
+        return None
+    if not (topic := board.topics.filter(db_order=topic_order).first()):
+        return None
+    return _etag(request.user.pk, topic.pk, topic.db_date_modified, topic.db_date_latest, request.GET.get('after', ''))
+
+
+@require_GET
+@condition(etag_func=board_list_etag)
+def board_list(request):
+    """
+    Lists the boards the requesting account may read.
+    """
+    boards = [{'id': board.pk,
+               'alias': board.prefix_order,
+               'name': board.key,
+               'next_post_number': board.db_next_post_number,
+               'mandatory': board.db_mandatory} for board in _visible_boards(request)]
+    return JsonResponse({'boards': boards})
+
+
+@require_GET
+@condition(etag_func=topic_page_etag)
+def topic_page(request, board_id):
+    """
+    Lists a board's topics by latest activity. Pass the returned 'next' cursor as ?before= for the next page.
+    """
+    if not (board := _visible_board(request, board_id)):
+        return _not_found('Board')
+    limit = board.posts_per_page()
+    try:
+        before = parse_cursor(cursor) if (cursor := request.GET.get('before', None)) else None
+    except ValueError as err:
+        return JsonResponse({'error': str(err)}, status=400)
+    topics = list(BoardTopic.recent(board, before=before)[:limit + 1])
+    next_cursor = None
+    if len(topics) > limit:
+        topics = topics[:limit]
+        next_cursor = make_cursor(topics[-1].db_date_latest, topics[-1].id)
+    data = [{'order': topic.db_order,
+             'name': topic.db_name,
+             'date_created': topic.db_date_created.isoformat(),
+             'date_modified': topic.db_date_modified.isoformat(),
+             'date_latest': topic.db_date_latest.isoformat()} for topic in topics]
+    return JsonResponse({'board': board.pk, 'topics': data, 'next': next_cursor})
+
+
+@require_GET
+@condition(etag_func=topic_posts_etag)
+def topic_posts(request, board_id, topic_order):
+    """
+    Lists a topic's posts in order. Pass the returned 'next' value as ?after= for the next page.
+    """
+    if not (board := _visible_board(request, board_id)):
+        return _not_found('Board')
+    if not (topic := board.topics.filter(db_order=topic_order).first()):
+        return _not_found('Topic')
+    limit = settings.BBS_PAGE_SIZE
+    posts = topic.posts.select_related('db_author').order_by('db_order')
+    if (after := request.GET.get('after', None)):
+        try:
+            posts = posts.filter(db_order__gt=int(after))
+        except ValueError:
+            return JsonResponse({'error': f"Invalid post number: {after}"}, status=400)
+    posts = list(posts[:limit + 1])
+    next_order = posts[limit - 1].db_order if len(posts) > limit else None
+    data = [{'order': post.db_order,
+             'author': str(post.db_author) if post.db_author else None,
+             'name': post.db_name,
+             'body': post.db_body,
+             'date_created': post.db_date_created.isoformat(),
+             'date_modified': post.db_date_modified.isoformat()} for post in posts[:limit]]
+    return JsonResponse({'board': board.pk, 'topic': topic.db_order, 'posts': data, 'next': next_order})